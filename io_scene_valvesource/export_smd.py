@@ -1307,8 +1307,7 @@ class Baker:
         )
 
         if ob.type == "ARMATURE":
-            for pb in ob.pose.bones:
-                pb.matrix_basis.identity()
+            reset_pose_bones(ob)
             result.armature = result
             result.object = ob
             return result
@@ -1439,9 +1438,9 @@ class Baker:
             result.envelope = bone_name
             result.armature = self.bake(armature)
             select_only(ob)
+            # (W @ P)^-1 == P^-1 @ W^-1, with one inversion instead of two
             result.bone_parent_matrix = (
-                armature.pose.bones[bone_name].matrix.inverted()
-                @ armature.matrix_world.inverted()
+                (armature.matrix_world @ armature.pose.bones[bone_name].matrix).inverted()
                 @ ob.matrix_world
             )
 
@@ -1507,23 +1506,30 @@ class Baker:
         print("- Normalizing Basis and Keys (Reference-Based)")
         blocks = ob.data.shape_keys.key_blocks
         base_key = blocks[0]
-        orig_coords = [v.co.copy() for v in base_key.data]
 
+        # Work on flat coordinate buffers: one foreach_get/foreach_set per key instead
+        # of a Vector read and write through RNA for every vertex.
+        def get_cos(key) -> list[float]:
+            cos = [0.0] * (len(key.data) * 3)
+            key.data.foreach_get("co", cos)
+            return cos
+
+        orig_coords = get_cos(base_key)
+
+        new_basis = orig_coords
         for key in blocks[1:]:
-            if key.slider_min == 0.0:
+            s_min = key.slider_min
+            if s_min == 0.0:
                 continue
-            for i, b_v in enumerate(base_key.data):
-                b_v.co += (key.data[i].co - orig_coords[i]) * key.slider_min
-
-        new_basis = [v.co.copy() for v in base_key.data]
+            new_basis = [b + (k - o) * s_min for b, k, o in zip(new_basis, get_cos(key), orig_coords)]
+        if new_basis is not orig_coords:
+            base_key.data.foreach_set("co", new_basis)
 
         for key in blocks[1:]:
             s_min, s_max = key.slider_min, key.slider_max
             old_val = key.value
             rng = s_max - s_min
-            for i, k_v in enumerate(key.data):
-                delta = k_v.co - orig_coords[i]
-                k_v.co = new_basis[i] + (delta * s_max - delta * s_min)
+            key.data.foreach_set("co", [b + (k - o) * rng for b, k, o in zip(new_basis, get_cos(key), orig_coords)])
             key.slider_min = 0.0
             key.slider_max = 1.0
             key.value = (old_val - s_min) / rng if rng != 0 else 0.0
@@ -2178,8 +2184,9 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
             for b in self.armature.data.bones
             if exporting_armature or b.use_deform
         ]
+        export_names = get_bone_exportnames(self.armature)
         self.exportable_boneNames = {
-            b.name: get_bone_exportname(b)
+            b.name: export_names[b.name]
             for b in self.armature.data.bones
             if exporting_armature or b.use_deform
         }
@@ -2489,6 +2496,17 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
             top = top.parent
         return top
 
+    def getExportedParentNames(self) -> dict[str, str | None]:
+        """Map each exported bone name to its nearest exported ancestor (None for roots)."""
+        exported = {pb.name for pb in self.exportable_bones}
+        parents = {}
+        for pb in self.exportable_bones:
+            parent = pb.parent
+            while parent and parent.name not in exported:
+                parent = parent.parent
+            parents[pb.name] = parent.name if parent else None
+        return parents
+
     def getEvaluatedPoseBones(self) -> list:
         depsgraph = bpy.context.evaluated_depsgraph_get()
         evaluated = self.armature.evaluated_get(depsgraph)
@@ -2548,14 +2566,13 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
                 self.smd_file.write(f"0 \"{implicit_bone_name}\" -1\n")
                 curID += 1
 
+            parent_names = self.getExportedParentNames()
             for bone in self.exportable_bones:
-                parent = bone.parent
-                while parent and parent not in self.exportable_bones:
-                    parent = parent.parent
+                parent_name = parent_names[bone.name]
 
                 self.bone_ids[bone.name] = curID
                 bone_name = self.exportable_boneNames[bone.name]
-                parent_id = str(self.bone_ids[parent.name]) if parent else "-1"
+                parent_id = str(self.bone_ids[parent_name]) if parent_name else "-1"
                 self.smd_file.write(f"{curID} \"{bone_name}\" {parent_id}\n")
                 curID += 1
 
@@ -2580,12 +2597,8 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
                 is_anim = len(bake_results) == 1 and bake_results[0].object.type == "ARMATURE"
                 anim_len = animationLength(self.armature.animation_data) + 1 if is_anim else 1
 
-                if not is_anim:
-                    for pb in self.armature.pose.bones:
-                        pb.matrix_basis.identity()
-                elif self.armature.data.vs.reset_pose_per_anim:
-                    for pb in self.armature.pose.bones:
-                        pb.matrix_basis.identity()
+                if not is_anim or self.armature.data.vs.reset_pose_per_anim:
+                    reset_pose_bones(self.armature)
 
                 for i in range(anim_len):
                     bpy.context.window_manager.progress_update(i / anim_len)
@@ -2596,10 +2609,10 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
                         bpy.context.scene.frame_set(i)
 
                     evaluated = self.getEvaluatedPoseBones()
+                    evaluated_by_name = {pb.name: pb for pb in evaluated}
                     for pb in evaluated:
-                        parent = pb.parent
-                        while parent and parent not in evaluated:
-                            parent = parent.parent
+                        parent_name = parent_names[pb.name]
+                        parent = evaluated_by_name[parent_name] if parent_name else None
 
                         mat = get_bone_matrix(pb, rest_space=not is_anim)
                         if parent:
@@ -2651,37 +2664,61 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
                                 weight_strs[vi] = str(valid[0][0])
 
                 src_mt = getattr(bake.src.vs, 'mesh_type', 'DEFAULT') if bake.src else 'DEFAULT'
-                num_polys = len(ob.data.polygons)
+                mesh = ob.data
+                num_polys = len(mesh.polygons)
+                num_loops = len(mesh.loops)
                 poly_progress_step = max(10, num_polys // 100)
                 lines = []
 
-                for p, poly in enumerate(ob.data.polygons):
+                # Pull each mesh attribute out as one flat array up front rather than
+                # walking loop/vertex RNA structs per corner. Vertex positions are
+                # shared by every corner using them, so they are formatted once.
+                vert_cos = [0.0] * (len(mesh.vertices) * 3)
+                mesh.vertices.foreach_get("co", vert_cos)
+                pos_strs = [getSmdVec(vert_cos[i:i + 3]) for i in range(0, len(vert_cos), 3)]
+                loop_verts = [0] * num_loops
+                mesh.loops.foreach_get("vertex_index", loop_verts)
+                loop_normals = [0.0] * (num_loops * 3)
+                mesh.loops.foreach_get("normal", loop_normals)
+                loop_uvs = [0.0] * (num_loops * 2)
+                uv_loop.foreach_get("uv", loop_uvs)
+
+                # The material line only depends on the polygon's slot index; resolve each
+                # slot once per object instead of once per polygon.
+                ignore_materials = src_mt in ('COLLISION', 'CLOTHPROXY')
+                mat_lines: dict[int, tuple[str, bool]] = {}
+
+                for p, poly in enumerate(mesh.polygons):
                     if p % poly_progress_step == 0:
                         bpy.context.window_manager.progress_update(p / num_polys)
-                    if src_mt in ('COLLISION', 'CLOTHPROXY'):
-                        mat_name, mat_ok = "no_material", True
-                    else:
-                        mat_name, mat_ok = self.GetMaterialName(ob, poly.material_index)
-                    if not mat_ok:
+                    mat_index = poly.material_index
+                    mat_line = mat_lines.get(mat_index)
+                    if mat_line is None:
+                        if ignore_materials:
+                            mat_name, mat_ok = "no_material", True
+                        else:
+                            mat_name, mat_ok = self.GetMaterialName(ob, mat_index)
+                        mat_line = mat_lines[mat_index] = (mat_name + "\n", mat_ok)
+                    if not mat_line[1]:
                         bad_face_mats += 1
-                    lines.append(mat_name + "\n")
+                    lines.append(mat_line[0])
 
-                    for loop in [ob.data.loops[l] for l in poly.loop_indices]:
-                        v = ob.data.vertices[loop.vertex_index]
-                        pos_norm = f"  {getSmdVec(v.co)}  {getSmdVec(loop.normal)}  "
-                        uv = " ".join(getSmdFloat(j) for j in uv_loop[loop.index].uv)
+                    for l in poly.loop_indices:
+                        vi = loop_verts[l]
+                        pos_norm = f"  {pos_strs[vi]}  {getSmdVec(loop_normals[l * 3:l * 3 + 3])}  "
+                        uv = getSmdVec(loop_uvs[l * 2:l * 2 + 2])
 
                         if not goldsrc:
-                            ws = ob_weight_str if ob_weight_str else weight_strs.get(v.index, " 0")
+                            ws = ob_weight_str if ob_weight_str else weight_strs.get(vi, " 0")
                             lines.append("0" + pos_norm + uv + ws + "\n")
                         else:
                             if ob_weight_str:
                                 ws = ob_weight_str
                             else:
-                                ws = weight_strs.get(v.index, "0")
-                                gw = [link for link in weights[v.index] if link[1] > 0]
+                                ws = weight_strs.get(vi, "0")
+                                gw = [link for link in weights[vi] if link[1] > 0]
                                 if len(gw) > 1:
-                                    multi_weight_verts.add(v)
+                                    multi_weight_verts.add(vi)
                             lines.append(ws + pos_norm + uv + "\n")
 
                 self.smd_file.writelines(lines)
@@ -2885,8 +2922,7 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
 
         if self.armature:
             if self.armature.data.vs.reset_pose_per_anim:
-                for pb in self.armature.pose.bones:
-                    pb.matrix_basis.identity()
+                reset_pose_bones(self.armature)
             bpy.context.view_layer.update()
 
         root["skeleton"] = DmeModel
@@ -2903,14 +2939,16 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
                 jointTransforms.append(DmeModel["transform"])
 
         bone_elements = {}
+        parent_names = {}
         if self.armature:
             armature_scale = self.armature.matrix_world.to_scale()
+            parent_names = self.getExportedParentNames()
 
         def writeBone(bone):
             if isinstance(bone, str):
                 bone_name, bone = bone, None
             else:
-                if bone and bone not in self.exportable_bones:
+                if bone and bone.name not in parent_names:
                     children = []
                     for child_elems in [writeBone(c) for c in bone.children]:
                         if child_elems:
@@ -2935,11 +2973,9 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
             if not bone:
                 relMat = Matrix()
             else:
-                cur_p = bone.parent
-                while cur_p and cur_p not in self.exportable_bones:
-                    cur_p = cur_p.parent
-                if cur_p:
-                    relMat = get_bone_matrix(cur_p, rest_space=True).inverted() @ bone.matrix
+                parent_name = parent_names[bone.name]
+                if parent_name:
+                    relMat = get_bone_matrix(self.armature.pose.bones[parent_name], rest_space=True).inverted() @ bone.matrix
                 else:
                     relMat = self.armature.matrix_world @ bone.matrix
 
@@ -3070,7 +3106,7 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
 
             if valid_hbox and hboxset_name:
                 inverted = [e.bone_name for e in valid_hbox
-                            if e.scale < 0.0 and any(e.vec_min[i] > e.vec_max[i] for i in range(3))]
+                            if e.scale < 0.0 and any(lo > hi for lo, hi in zip(e.vec_min, e.vec_max))]
                 if inverted:
                     self.warning(
                         f"Hitbox min/max are inverted on {len(inverted)} box hitbox(es): Source Engine "
@@ -3084,8 +3120,9 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
                 hbox_set_list["hitboxSetList"].append(hbox_set)
 
                 for hi, e in enumerate(valid_hbox):
-                    bone = arm_data.bones[e.bone_name]
-                    bone_export = self.exportable_boneNames.get(e.bone_name, get_bone_exportname(bone))
+                    bone_export = self.exportable_boneNames.get(e.bone_name)
+                    if bone_export is None:
+                        bone_export = get_bone_exportname(arm_data.bones[e.bone_name])
                     hb = dm.add_element(bone_export, "DmeHitbox", id=f"hitbox_{hboxset_name}_{hi}_{e.bone_name}")
                     _hitbox.write_dme_attrs(hb, e, bone_export)
                     hbox_set["hitboxList"].append(hb)
@@ -3237,32 +3274,38 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
             def remap(val, a, b, c, d):
                 return (((val - a) * (d - c)) / (b - a)) + c
 
+            # VertexGroup.weight() raises for a vertex outside the group, so read group
+            # membership from each vertex's own (short) group list instead. Resolve the
+            # group indices and each cloth group's remap range once up front.
+            balance_vg_index = -1
+            if bake.shapes and isinstance(bake.balance_vg, bpy.types.VertexGroup):
+                balance_vg_index = bake.balance_vg.index
+            # else: balance[] was pre-populated by axis-based stereo setup (or is unused)
+            cloth_reads = []
+            for vgroup in cloth_groups or ():
+                remap_range = next(((r.min, r.max) for r in ob.vs.vertex_map_remaps
+                                    if r.group == vgroup.name), None)
+                cloth_reads.append((vgroup.index, cloth_weights[vgroup.name], remap_range))
+            read_groups = balance_vg_index != -1 or bool(cloth_reads)
+
             bench.report("object setup")
 
             for v in ob.data.vertices:
                 v.select = False
-                if bake.shapes and bake.balance_vg:
-                    if isinstance(bake.balance_vg, bpy.types.VertexGroup):
-                        try:
-                            balance[v.index] = bake.balance_vg.weight(v.index)
-                        except Exception:
-                            pass
-                    # else: balance[] was pre-populated by axis-based stereo setup
-
-                if cloth_groups:
-                    for vgroup in cloth_groups:
-                        try:
-                            w = vgroup.weight(v.index)
-                            for r in ob.vs.vertex_map_remaps:
-                                if r.group == vgroup.name:
-                                    w = remap(w, 0.0, 1.0, r.min, r.max)
-                                    break
-                            cloth_weights[vgroup.name][v.index] = w
-                        except Exception:
-                            for r in ob.vs.vertex_map_remaps:
-                                if r.group == vgroup.name:
-                                    cloth_weights[vgroup.name][v.index] = r.min
-                                    break
+                if read_groups:
+                    v_weights = {g.group: g.weight for g in v.groups}
+
+                    if balance_vg_index != -1:
+                        w = v_weights.get(balance_vg_index)
+                        if w is not None:
+                            balance[v.index] = w
+
+                    for vg_index, weights, remap_range in cloth_reads:
+                        w = v_weights.get(vg_index)
+                        if remap_range is not None:
+                            weights[v.index] = remap(w, 0.0, 1.0, *remap_range) if w is not None else remap_range[0]
+                        elif w is not None:
+                            weights[v.index] = w
 
                 if have_weightmap:
                     weights_row = [0.0] * jointCount
@@ -3819,36 +3862,52 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
             two_percent = num_frames / 50
             print("Frames: ", debug_only=True, newline=False)
 
+            # Everything below runs once per bone per frame, so resolve the log layer
+            # arrays and the per-bone hierarchy facts up front instead of going back
+            # through the datamodel elements and RNA every time.
+            bone_logs = {
+                name: [(layer["times"], layer["values"]) for layer in layers]
+                for name, layers in bone_channels.items()
+            }
+            has_parent = {pb.name for pb in self.exportable_bones if pb.parent}
+            Vector3 = datamodel.Vector3
+            frame_set = bpy.context.scene.frame_set
+            progress_update = bpy.context.window_manager.progress_update
+
             for frame in range(num_frames):
-                bpy.context.window_manager.progress_update(frame / num_frames)
-                bpy.context.scene.frame_set(frame)
+                progress_update(frame / num_frames)
+                frame_set(frame)
                 keyframe_time = datamodel.Time(frame / fps) if dm.format_ver > 11 else int(frame / fps * 10000)
                 evaluated = self.getEvaluatedPoseBones()
+                evaluated_by_name = {pb.name: pb for pb in evaluated}
+                arm_matrix_world = self.armature.matrix_world
 
                 for bone in evaluated:
-                    channel = bone_channels[bone.name]
-                    cur_p = bone.parent
-                    while cur_p and cur_p not in evaluated:
-                        cur_p = cur_p.parent
-                    if cur_p:
-                        relMat = get_bone_matrix(cur_p).inverted() @ bone.matrix
+                    bone_name = bone.name
+                    logs = bone_logs[bone_name]
+                    parent_name = parent_names[bone_name]
+                    if parent_name:
+                        relMat = get_bone_matrix(evaluated_by_name[parent_name]).inverted() @ bone.matrix
                     else:
-                        relMat = self.armature.matrix_world @ bone.matrix
+                        relMat = arm_matrix_world @ bone.matrix
                     relMat = get_bone_matrix(relMat, bone)
 
                     pos = relMat.to_translation()
-                    if bone.parent:
+                    if bone_name in has_parent:
                         for j in range(3):
                             pos[j] *= armature_scale[j]
 
-                    channel[0]["times"].append(keyframe_time)
-                    channel[0]["values"].append(datamodel.Vector3(pos))
-                    channel[1]["times"].append(keyframe_time)
-                    channel[1]["values"].append(getDatamodelQuat(relMat.to_quaternion()))
+                    times, values = logs[0]
+                    times.append(keyframe_time)
+                    values.append(Vector3(pos))
+                    times, values = logs[1]
+                    times.append(keyframe_time)
+                    values.append(getDatamodelQuat(relMat.to_quaternion()))
                     if export_bone_scale:
                         s = relMat.to_scale()
-                        channel[2]["times"].append(keyframe_time)
-                        channel[2]["values"].append((s.x + s.y + s.z) / 3.0)
+                        times, values = logs[2]
+                        times.append(keyframe_time)
+                        values.append((s.x + s.y + s.z) / 3.0)
 
                 if two_percent and frame % two_percent:
                     print(".", debug_only=True, newline=False)
@@ -3873,10 +3932,10 @@ class SmdExporter(bpy.types.Operator, Logger, ExportCheck):
         return written
 
 
-def _s2_prefab_bonename(bone) -> str:
+def _s2_prefab_bonename(bone, export_names: dict[str, str] | None = None) -> str:
     # I don't know if ValveBiped. is only stripped or it applies to any with . separator
     # TODO: Confirm.
-    name = get_bone_exportname(bone)
+    name = export_names[bone.name] if export_names is not None else get_bone_exportname(bone)
     prefix = "ValveBiped."
     return name[len(prefix):] if name.startswith(prefix) else name
 
@@ -3890,7 +3949,15 @@ PREFAB_FILENAME_SUFFIX = {
     'PROCEDURAL':    'procedural',
 }
 
-_PREFAB_EXTENSIONS = {'.qc', '.qci', '.vmdl', '.vmdl_prefab', '.vrd'}
+# Prefab file extension -> output format
+_PREFAB_EXT_FORMATS = {
+    '.qc':          'QC',
+    '.qci':         'QC',
+    '.vmdl':        'VMDL',
+    '.vmdl_prefab': 'VMDL',
+    '.vrd':         'VRD',
+}
+_PREFAB_EXTENSIONS = frozenset(_PREFAB_EXT_FORMATS)
 
 
 def _prefab_extension(prefab_type: str) -> str:
@@ -3902,14 +3969,7 @@ def _prefab_extension(prefab_type: str) -> str:
 
 
 def _prefab_format_from_ext(ext: str) -> str | None:
-    ext = ext.lower()
-    if ext in {'.qc', '.qci'}:
-        return 'QC'
-    if ext in {'.vmdl', '.vmdl_prefab'}:
-        return 'VMDL'
-    if ext == '.vrd':
-        return 'VRD'
-    return None
+    return _PREFAB_EXT_FORMATS.get(ext.lower())
 
 
 def resolve_prefab_output(arm: bpy.types.Object, prefab_type: str, scene) -> tuple[str, str] | None:
@@ -3939,7 +3999,7 @@ def resolve_prefab_output(arm: bpy.types.Object, prefab_type: str, scene) -> tup
     if not raw:
         if not base_dir:
             return None
-        full = os.path.join(base_dir, default_name)
+        full, full_ext = os.path.join(base_dir, default_name), ext
     else:
         raw_norm = raw.replace('\\', '/')
         if raw_norm.startswith('//') or os.path.isabs(raw_norm):
@@ -3949,16 +4009,17 @@ def resolve_prefab_output(arm: bpy.types.Object, prefab_type: str, scene) -> tup
         else:
             expanded = bpy.path.abspath(raw_norm)
 
-        if os.path.splitext(expanded)[1].lower() in _PREFAB_EXTENSIONS:
-            full = expanded
+        expanded_ext = os.path.splitext(expanded)[1].lower()
+        if expanded_ext in _PREFAB_EXTENSIONS:
+            full, full_ext = expanded, expanded_ext
         else:
-            full = os.path.join(expanded, default_name)
+            full, full_ext = os.path.join(expanded, default_name), ext
 
-    full = os.path.normpath(full)
-    fmt = _prefab_format_from_ext(os.path.splitext(full)[1])
+    # The extension was settled above; normpath never changes it, so no second split.
+    fmt = _prefab_format_from_ext(full_ext)
     if fmt is None:
         return None
-    return full, fmt
+    return os.path.normpath(full), fmt
 
 
 class PrefabExporter(bpy.types.Operator, ExportCheck):
@@ -3982,8 +4043,12 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
         if not compiled:
             return False
 
+        # VMDL runners hand back the KVDocument itself so it can be streamed to disk
+        # rather than first materialised as one string.
+        is_kv_doc = isinstance(compiled, KVDocument)
+
         if self.to_clipboard:
-            bpy.context.window_manager.clipboard = compiled
+            bpy.context.window_manager.clipboard = compiled.to_text() if is_kv_doc else compiled
             self.report({'INFO'}, "Data copied to clipboard")
             return True
 
@@ -3991,9 +4056,28 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             self.report({'ERROR'}, "No export path provided")
             return False
 
-        os.makedirs(os.path.dirname(export_path), exist_ok=True)
-        with open(export_path, "w", encoding="utf-8") as f:
-            f.write(compiled)
+        # Stream into a sibling temp file and swap it in at the end, so an error while
+        # serialising cannot truncate the existing file (often the .vmdl being merged into).
+        # The target folder usually exists already; only create it when the open says so.
+        tmp_path = export_path + ".tmp"
+        try:
+            f = open(tmp_path, "w", encoding="utf-8", buffering=1 << 16)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(export_path), exist_ok=True)
+            f = open(tmp_path, "w", encoding="utf-8", buffering=1 << 16)
+        try:
+            with f:
+                if is_kv_doc:
+                    compiled.write(f)
+                else:
+                    f.write(compiled)
+            os.replace(tmp_path, export_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
         if warnings:
             self.report({'WARNING'}, f"Exported with {len(warnings)} warning(s) (see console)")
@@ -4018,7 +4102,7 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             arm = get_armature(context.active_object)
             self.to_clipboard = context.scene.vs.prefab_to_clipboard
 
-            bone_names = {bone.name: get_bone_exportname(bone) for bone in arm.data.bones}
+            bone_names = get_bone_exportnames(arm)
             if not self.check_duplicate_bone_names(bone_names):
                 return {'CANCELLED'}
 
@@ -4074,52 +4158,58 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             self.report({'WARNING'}, "No jigglebones found")
             return None
 
-        collection_groups = {}
+        collection_groups = collections.defaultdict(list)
         for bone in jigglebones:
-            group_name = bone.collections[0].name if bone.collections else "Others"
-            collection_groups.setdefault(group_name, []).append(bone)
+            bone_collections = bone.collections
+            collection_groups[bone_collections[0].name if bone_collections else "Others"].append(bone)
+
+        # Every bone's export name depends on the whole hierarchy; resolve them all once.
+        export_names = get_bone_exportnames(arm)
 
         if self.to_clipboard:
-            return self._jigglebones_vmdl(collection_groups, None) if State.compiler == Compiler.MODELDOC else self._jigglebones_qc(collection_groups)
+            return self._jigglebones_vmdl(collection_groups, export_names, None) if State.compiler == Compiler.MODELDOC else self._jigglebones_qc(collection_groups, export_names)
         if fmt == 'QC':
-            return self._jigglebones_qc(collection_groups)
+            return self._jigglebones_qc(collection_groups, export_names)
         if fmt == 'VMDL':
-            return self._jigglebones_vmdl(collection_groups, export_path)
+            return self._jigglebones_vmdl(collection_groups, export_names, export_path)
         return None
 
-    def _jigglebones_qc(self, collection_groups):
-        entries = []
-        for group_name, group_bones in collection_groups.items():
-            entries.append(f"// Jigglebones: {group_name}")
-            entries.append("")
-            for bone in group_bones:
-                entries.append("\n".join(_jigglebone.qc_block_lines(bone)))
-        return "\n".join(entries)
-
-    def _jigglebones_vmdl(self, collection_groups, export_path):
-        folder_nodes = []
-        for group_name, group_bones in collection_groups.items():
-            folder = KVNode(_class="Folder", name=sanitize_string(group_name))
-            for bone in group_bones:
-                s2name = _s2_prefab_bonename(bone)
-                jiggle_length = bone.length if bone.vs.use_bone_length_for_jigglebone_length else bone.vs.jiggle_length
-                folder.add_child(KVNode(
-                    _class="JiggleBone",
-                    name=f"JiggleBone_{s2name}",
-                    **_jigglebone.kv3_kwargs(bone.vs, s2name, jiggle_length),
-                ))
-            folder_nodes.append(folder)
+    def _jigglebones_qc(self, collection_groups, export_names):
+        # Block lines are joined once with everything else, not per bone and then again.
+        def lines():
+            for group_name, group_bones in collection_groups.items():
+                yield f"// Jigglebones: {group_name}"
+                yield ""
+                for bone in group_bones:
+                    yield from _jigglebone.qc_block_lines(bone, export_names[bone.name])
+        return "\n".join(lines())
+
+    def _jigglebones_vmdl(self, collection_groups, export_names, export_path):
+        # Folders are built lazily as update_vmdl_container consumes them.
+        def folder_nodes():
+            for group_name, group_bones in collection_groups.items():
+                children = []
+                for bone in group_bones:
+                    bvs = bone.vs
+                    s2name = _s2_prefab_bonename(bone, export_names)
+                    jiggle_length = bone.length if bvs.use_bone_length_for_jigglebone_length else bvs.jiggle_length
+                    children.append(KVNode(
+                        _class="JiggleBone",
+                        name=f"JiggleBone_{s2name}",
+                        **_jigglebone.kv3_kwargs(bvs, s2name, jiggle_length),
+                    ))
+                yield KVNode(children=children, _class="Folder", name=sanitize_string(group_name))
 
         kv_doc = update_vmdl_container(
             container_class="JiggleBoneList" if not self.to_clipboard else "ScratchArea",
-            nodes=folder_nodes,
+            nodes=folder_nodes(),
             export_path=export_path,
             to_clipboard=self.to_clipboard
         )
         if kv_doc is False:
             self.report({"WARNING"}, 'Existing file may not be a valid KeyValues3')
             return None
-        return kv_doc.to_text()
+        return kv_doc
 
     # Attachments
 
@@ -4141,8 +4231,9 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
                 lookat_by_driver[driver_name].append(off)
 
         result = []
+        export_names = get_bone_exportnames(arm) if lookat_by_driver else {}
         for driver_name, offsets in lookat_by_driver.items():
-            driver_export = get_bone_exportname(arm.data.bones[driver_name])
+            driver_export = export_names[driver_name]
             attach_base   = driver_export.split('.', 1)[-1]
             multiple      = len(offsets) > 1
             for idx, off in enumerate(offsets, start=1):
@@ -4170,48 +4261,51 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             return self._attachments_vmdl(arm, attachments, export_path)
         return None
 
-    def _attachments_qc(self, arm, attachments, lookat_attachments=()):
-        lines = []
+    def _attachment_rel_matrices(self, arm, attachments):
+        """Yield (empty, bone, relMat) for each attachment with a valid parent bone.
+
+        Empties often share a parent bone, so each bone's inverted rest matrix is
+        computed once and reused for all of its attachments.
+        """
+        parent_inv = {}
         for empty in attachments:
             if not empty.parent_bone:
                 continue
             bone = arm.data.bones.get(empty.parent_bone)
             if not bone:
                 continue
-            pose_bone = arm.pose.bones.get(empty.parent_bone)
-            if not pose_bone:
-                continue
-            pmat = get_bone_matrix(pose_bone, rest_space=True)
-            relMat = pmat.inverted() @ empty.matrix_world
+            inv = parent_inv.get(empty.parent_bone)
+            if inv is None:
+                pose_bone = arm.pose.bones.get(empty.parent_bone)
+                if not pose_bone:
+                    continue
+                inv = parent_inv[empty.parent_bone] = get_bone_matrix(pose_bone, rest_space=True).inverted()
+            yield empty, bone, inv @ empty.matrix_world
+
+    def _attachments_qc(self, arm, attachments, lookat_attachments=()):
+        export_names = get_bone_exportnames(arm)
+        lines = []
+        for empty, bone, relMat in self._attachment_rel_matrices(arm, attachments):
             position = relMat.to_translation()
             rotation = relMat.to_quaternion().to_euler('XYZ')
-            lines.append(f'$attachment "{empty.name}" "{get_bone_exportname(bone)}" {position.x:.2f} {position.y:.2f} {position.z:.2f} rotate {math.degrees(rotation.y):.0f} {math.degrees(rotation.z):.0f} {math.degrees(rotation.x):.0f}')
+            lines.append(f'$attachment "{empty.name}" "{export_names[bone.name]}" {position.x:.2f} {position.y:.2f} {position.z:.2f} rotate {math.degrees(rotation.y):.0f} {math.degrees(rotation.z):.0f} {math.degrees(rotation.x):.0f}')
         for attach_name, driver_name, off in lookat_attachments:
             bone = arm.data.bones.get(driver_name)
             if not bone:
                 continue
-            lines.append(f'$attachment "{attach_name}" "{get_bone_exportname(bone)}" {off[0]:.6f} {off[1]:.6f} {off[2]:.6f} rotate 0 0 0')
+            lines.append(f'$attachment "{attach_name}" "{export_names[bone.name]}" {off[0]:.6f} {off[1]:.6f} {off[2]:.6f} rotate 0 0 0')
         return '\n'.join(lines)
 
     def _attachments_vmdl(self, arm, attachments, export_path):
+        export_names = get_bone_exportnames(arm)
         nodes = []
-        for empty in attachments:
-            if not empty.parent_bone:
-                continue
-            bone = arm.data.bones.get(empty.parent_bone)
-            if not bone:
-                continue
-            pose_bone = arm.pose.bones.get(empty.parent_bone)
-            if not pose_bone:
-                continue
-            pmat = get_bone_matrix(pose_bone, rest_space=True)
-            relMat = pmat.inverted() @ empty.matrix_world
+        for empty, bone, relMat in self._attachment_rel_matrices(arm, attachments):
             position = relMat.translation
             rotation = relMat.to_euler('YZX')
             nodes.append(KVNode(
                 _class="Attachment",
                 name=empty.name,
-                parent_bone=_s2_prefab_bonename(bone),
+                parent_bone=_s2_prefab_bonename(bone, export_names),
                 relative_origin=KVVector3(position.x, position.y, position.z),
                 relative_angles=KVVector3(math.degrees(rotation.y), math.degrees(rotation.z), math.degrees(rotation.x)),
                 weight=1.0,
@@ -4227,7 +4321,7 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
         if kv_doc is False:
             self.report({"WARNING"}, 'Existing file may not be a valid KeyValues3')
             return None
-        return kv_doc.to_text()
+        return kv_doc
 
     # Hitboxes
 
@@ -4258,8 +4352,14 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
 
     def _hitboxes_qc(self, arm, valid, hboxset):
         avs = getattr(arm.data, 'vs', None)
+        capsule_support = getattr(avs, 'hbox_capsule_support', False)
+
+        # Group by bone and collect every warning in one pass over the entries
         bones_for_sort = []
         seen_bones = {}
+        inverted = []
+        skipped_capsules = []
+        skipped_rotations = []
         for e in valid:
             bone = arm.data.bones[e.bone_name]
             if bone not in seen_bones:
@@ -4267,34 +4367,40 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
                 seen_bones[bone] = []
             seen_bones[bone].append(e)
 
-        inverted = [e.bone_name for e in valid
-                    if e.scale < 0.0 and any(e.vec_min[i] > e.vec_max[i] for i in range(3))]
+            if e.scale < 0.0:
+                if any(lo > hi for lo, hi in zip(e.vec_min, e.vec_max)):
+                    inverted.append(e.bone_name)
+            elif not capsule_support:
+                skipped_capsules.append(e.bone_name)
+            if not capsule_support:
+                rx, ry, rz = e.rotation
+                if max(abs(rx), abs(ry), abs(rz)) > 1e-6:
+                    skipped_rotations.append(e.bone_name)
+
         if inverted:
             self.report({'WARNING'},
                 f"Hitbox min/max are inverted on {len(inverted)} box hitbox(es) : Source Engine will "
                 f"invert hit registration. Swap Min and Max for: {', '.join(inverted)}")
 
         sorted_bones = sort_bone_by_hierarchy(bones_for_sort)
-        capsule_support = getattr(avs, 'hbox_capsule_support', False)
 
-        if not capsule_support:
-            skipped_capsules  = [e.bone_name for e in valid if e.scale >= 0.0]
-            skipped_rotations = [e.bone_name for e in valid
-                                 if any(abs(r) > 1e-6 for r in e.rotation)]
-            if skipped_capsules:
-                self.report({'WARNING'},
-                    f"Capsule Support is disabled : {len(skipped_capsules)} capsule hitbox(es) will be "
-                    f"exported as boxes (bones: {', '.join(skipped_capsules)})")
-            if skipped_rotations:
-                self.report({'WARNING'},
-                    f"Capsule Support is disabled : rotation is ignored on {len(skipped_rotations)} "
-                    f"hitbox(es) (bones: {', '.join(skipped_rotations)})")
-
-        lines = []
-        lines.append(f'$hboxset\t"{hboxset}"')
-        for bone in sorted_bones:
-            for e in seen_bones[bone]:
-                lines.append(_hitbox.qc_line(e, get_bone_exportname(bone), capsule_support))
+        if skipped_capsules:
+            self.report({'WARNING'},
+                f"Capsule Support is disabled : {len(skipped_capsules)} capsule hitbox(es) will be "
+                f"exported as boxes (bones: {', '.join(skipped_capsules)})")
+        if skipped_rotations:
+            self.report({'WARNING'},
+                f"Capsule Support is disabled : rotation is ignored on {len(skipped_rotations)} "
+                f"hitbox(es) (bones: {', '.join(skipped_rotations)})")
+
+        export_names = get_bone_exportnames(arm)
+        qc_line = _hitbox.qc_line
+        lines = [f'$hboxset\t"{hboxset}"']
+        lines.extend(
+            qc_line(e, export_names[bone.name], capsule_support)
+            for bone in sorted_bones
+            for e in seen_bones[bone]
+        )
         lines.append('$skipboneinbbox')
 
         return '\n'.join(lines), None
@@ -4302,8 +4408,10 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
     def _hitboxes_vmdl(self, arm, valid, hboxset, export_path):
         # Source 2 / ModelDoc only supports capsule hitboxes. A hitbox is a capsule
         # when its scale (capsule radius) is >= 0; scale < 0 means an oriented box.
-        capsules = [e for e in valid if e.scale >= 0.0]
-        boxes    = [e for e in valid if e.scale < 0.0]
+        capsules = []
+        boxes    = []
+        for e in valid:
+            (capsules if e.scale >= 0.0 else boxes).append(e)
 
         if boxes:
             bnames = ', '.join(sorted({e.bone_name for e in boxes}))
@@ -4326,13 +4434,16 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             seen_bones[bone].append(e)
         sorted_bones = sort_bone_by_hierarchy(bones_for_sort)
 
-        hbset_node = KVNode(_class="HitboxSet", name=sanitize_string(hboxset))
-        for bone in sorted_bones:
-            for e in seen_bones[bone]:
-                hbset_node.add_child(KVNode(
-                    _class="HitboxCapsule",
-                    **_hitbox.kv3_capsule_kwargs(e, _s2_prefab_bonename(bone)),
-                ))
+        export_names = get_bone_exportnames(arm)
+        hbset_node = KVNode(
+            children=[
+                KVNode(_class="HitboxCapsule", **_hitbox.kv3_capsule_kwargs(e, _s2_prefab_bonename(bone, export_names)))
+                for bone in sorted_bones
+                for e in seen_bones[bone]
+            ],
+            _class="HitboxSet",
+            name=sanitize_string(hboxset),
+        )
 
         # update_vmdl_container matches the HitboxSet by name inside HitboxSetList and
         # replaces its children, so an existing set with this name is overwritten in full.
@@ -4345,7 +4456,7 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
         if kv_doc is False:
             self.report({"WARNING"}, 'Existing file may not be a valid KeyValues3')
             return None, None
-        return kv_doc.to_text(), None
+        return kv_doc, None
 
     # Procedural VRD
 
@@ -4377,8 +4488,11 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
 
         scale = scene.vs.world_scale * arm.matrix_world.to_scale().x
 
+        # Export names depend on the whole hierarchy; resolve them once for every lookup below.
+        export_names = get_bone_exportnames(arm)
+
         def _vrd_name(bone):
-            return get_bone_exportname(bone).split('.', 1)[-1]
+            return export_names[bone.name].split('.', 1)[-1]
 
         def _basepos(helper_name, parent_name):
             h_pb = arm.pose.bones.get(helper_name)
@@ -4407,16 +4521,11 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             rot_x = 0.0 if bvs.ignore_rotation_offset else bvs.export_rotation_offset_x
             rot_y = 0.0 if bvs.ignore_rotation_offset else bvs.export_rotation_offset_y
             rot_z = 0.0 if bvs.ignore_rotation_offset else bvs.export_rotation_offset_z
-            rot_mat = (Matrix.Rotation(rot_z, 4, 'Z') @
+            off_mat = (Matrix.Rotation(rot_z, 4, 'Z') @
                     Matrix.Rotation(rot_y, 4, 'Y') @
                     Matrix.Rotation(rot_x, 4, 'X'))
-            return Matrix.Translation((loc_x, loc_y, loc_z)) @ rot_mat
-
-        def _driver_parent_vrd(driver_bone_name):
-            db = arm.data.bones.get(driver_bone_name)
-            if db and db.parent:
-                return _vrd_name(db.parent)
-            return _vrd_name(arm.data.bones[driver_bone_name]) if db else driver_bone_name.split('.', 1)[-1]
+            off_mat.translation = (loc_x, loc_y, loc_z)
+            return off_mat
 
         # Build lookat attachment name map (same deduplication as _collect_lookat_attachments)
         lookat_by_driver: dict[str, list[tuple]] = {}
@@ -4432,11 +4541,30 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
                 lookat_by_driver[dn].append(off)
         lookat_name_map: dict[tuple, str] = {}
         for dn, offsets in lookat_by_driver.items():
-            attach_base = get_bone_exportname(arm.data.bones[dn]).split('.', 1)[-1]
+            attach_base = _vrd_name(arm.data.bones[dn])
             multiple = len(offsets) > 1
             for idx, off in enumerate(offsets, start=1):
                 lookat_name_map[(dn, off)] = f"{attach_base}_lookat{idx}" if multiple else f"{attach_base}_lookat"
 
+        # Sample the TRIGGER entries that share an action datablock and slot together,
+        # so each group steps through its frames once instead of once per entry.
+        trigger_groups: dict[tuple, list[tuple]] = {}
+        for entry_idx, entry in enumerate(entries):
+            if getattr(entry, 'proc_type', 'TRIGGER') != 'TRIGGER' or not entry.action:
+                continue
+            if not entry.driver_bone or not arm.data.bones.get(entry.driver_bone):
+                continue
+            if not entry.helper_bone or not arm.data.bones.get(entry.helper_bone):
+                continue
+            key = (entry.action.as_pointer(), entry.action_slot_name)
+            trigger_groups.setdefault(key, []).append((entry_idx, entry))
+        # entry index -> (triggers, progress/warning line printed when the entry is written)
+        sampled_triggers: dict[int, tuple] = {}
+        for group in trigger_groups.values():
+            batch = _pbsim._build_proc_triggers_batch(arm, [e for _, e in group], scene, export_print=True)
+            for (entry_idx, _), sampled in zip(group, batch):
+                sampled_triggers[entry_idx] = sampled
+
         lines: list[str] = []
 
         for entry_idx, entry in enumerate(entries):
@@ -4451,10 +4579,13 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             driver_bone = arm.data.bones[driver_name]
             helper_vrd  = _vrd_name(helper_bone)
             driver_vrd  = _vrd_name(driver_bone)
+            # Each .parent read crosses into RNA; read them once per entry.
+            helper_parent = helper_bone.parent
+            driver_parent = driver_bone.parent
 
-            if helper_bone.parent:
-                parent_name = helper_bone.parent.name
-                parent_vrd  = _vrd_name(helper_bone.parent)
+            if helper_parent:
+                parent_name = helper_parent.name
+                parent_vrd  = _vrd_name(helper_parent)
             else:
                 parent_name = driver_name
                 parent_vrd  = driver_vrd
@@ -4462,7 +4593,7 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
             bx, by, bz = _basepos(helper_name, parent_name)
 
             if proc_type == 'TRIGGER':
-                drv_parent_vrd = _driver_parent_vrd(driver_name)
+                drv_parent_vrd = _vrd_name(driver_parent) if driver_parent else driver_vrd
                 lines.append(f'<helper>  {helper_vrd}  {parent_vrd}  {drv_parent_vrd}  {driver_vrd}')
                 lines.append(f'<basepos>  {bx:.6f} {by:.6f} {bz:.6f}')
 
@@ -4472,29 +4603,31 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
                     lines.append('')
                     continue
 
-                tol_deg  = degrees(arm.data.bones[driver_name].vs.proc_tolerance)
+                tol_deg  = degrees(driver_bone.vs.proc_tolerance)
                 d_pb = arm.pose.bones.get(driver_name)
                 h_pb = arm.pose.bones.get(helper_name)
+                d_pb_parent = d_pb.parent if d_pb else None
+                h_pb_parent = h_pb.parent if h_pb else None
 
                 d_off        = _export_off_mat(d_pb)          if d_pb                  else Matrix.Identity(4)
                 h_off        = _export_off_mat(h_pb)          if h_pb                  else Matrix.Identity(4)
-                d_parent_off = _export_off_mat_rot_only(d_pb.parent) if d_pb and d_pb.parent else Matrix.Identity(4)
-                h_parent_off = _export_off_mat_rot_only(h_pb.parent) if h_pb and h_pb.parent else Matrix.Identity(4)
+                # Only the inverse parent offsets are used; invert once per entry, not per trigger.
+                d_parent_inv = _export_off_mat_rot_only(d_pb_parent).inverted() if d_pb_parent else Matrix.Identity(4)
+                h_parent_inv = _export_off_mat_rot_only(h_pb_parent).inverted() if h_pb_parent else Matrix.Identity(4)
 
-                # _build_proc_triggers() stores matrix_basis (animation delta from rest).
+                # _build_proc_triggers_batch() stores matrix_basis (animation delta from rest).
                 # VRD expects the absolute local rotation, so bake the rest orientation in here.
-                d_rest_rot = Matrix.Identity(4)
-                _d_bone_data = arm.data.bones.get(driver_name)
-                if _d_bone_data:
-                    if _d_bone_data.parent:
-                        d_rest_rot = (
-                            _d_bone_data.parent.matrix_local.to_3x3().normalized().inverted() @
-                            _d_bone_data.matrix_local.to_3x3().normalized()
-                        ).to_4x4()
-                    else:
-                        d_rest_rot = _d_bone_data.matrix_local.to_3x3().normalized().to_4x4()
+                if driver_parent:
+                    d_rest_rot = (
+                        driver_parent.matrix_local.to_3x3().normalized().inverted() @
+                        driver_bone.matrix_local.to_3x3().normalized()
+                    ).to_4x4()
+                else:
+                    d_rest_rot = driver_bone.matrix_local.to_3x3().normalized().to_4x4()
 
-                triggers = _pbsim._build_proc_triggers(arm, entry, entry_idx, scene, export_print=True)
+                triggers, message = sampled_triggers.get(entry_idx, ([], None))
+                if message:
+                    print(message)
 
                 #print(f"[VRD DEBUG] {len(triggers)} triggers for '{entry.helper_bone}'")
                 #for i, (dq, dloc, hloc, hq, tol) in enumerate(triggers):
@@ -4534,13 +4667,13 @@ class PrefabExporter(bpy.types.Operator, ExportCheck):
                     # parent_off.inv @ rest_local @ delta @ own_off
                     # mirrors how get_bone_matrix works: offset is post-multiplied,
                     # so Source sees child relative to parent including both offsets.
-                    d_mat   = d_parent_off.inverted() @ d_rest_rot @ dq.to_matrix().to_4x4() @ d_off
+                    d_mat   = d_parent_inv @ d_rest_rot @ dq.to_matrix().to_4x4() @ d_off
                     d_euler = d_mat.to_euler('XYZ')
                     drx, dry, drz = degrees(d_euler.x), degrees(d_euler.y), degrees(d_euler.z)
 
                     h_mat    = hq.to_matrix().to_4x4()
                     h_mat.translation = hloc
-                    h_export = h_parent_off.inverted() @ h_mat @ h_off
+                    h_export = h_parent_inv @ h_mat @ h_off
                     h_pos    = h_export.to_translation()
                     h_euler  = h_export.to_euler('XYZ')
 
@@ -29,6 +29,11 @@ from .operators import (
 )
 
 
+# In DME mode jigglebones/attachments/hitboxes are encoded into the model DMX, so their
+# standalone .qci export buttons are dead-ends. Procedural bones still export as a .vrd.
+_DME_ENCODED_PREFABS = frozenset({'JIGGLEBONES', 'ATTACHMENTS', 'HITBOXES'})
+
+
 class SMD_MT_ExportChoice(Menu):
     bl_label = get_id("exportmenu_title")
 
@@ -38,13 +43,16 @@ class SMD_MT_ExportChoice(Menu):
 
         exportables = list(getSelectedExportables())
         if len(exportables):
-            single_obs = list([ex for ex in exportables if ex.ob_type != 'COLLECTION'])
-            groups = list([ex for ex in exportables if ex.ob_type == 'COLLECTION'])
+            single_obs = []
+            groups = []
+            for ex in exportables:
+                (groups if ex.ob_type == 'COLLECTION' else single_obs).append(ex)
             groups.sort(key=lambda g: g.name.lower())
 
             group_layout = l
+            in_scene_panel = type(self).__name__ == 'SMD_PT_Scene'
             for i,group in enumerate(groups): # always display all possible groups, as an object could be part of several
-                if type(self).__name__ == 'SMD_PT_Scene':
+                if in_scene_panel:
                     if i == 0: group_col = l.column(align=True)
                     if i % 2 == 0: group_layout = group_col.row(align=True)
                 group_layout.operator(SmdExporter.bl_idname, text=group.name, icon='GROUP').collection = group.item.name
@@ -85,11 +93,8 @@ class SMD_MT_ExportChoice(Menu):
                 if is_attachment:
                     allowed.add('ATTACHMENTS')
 
-            # In DME mode jigglebones/attachments/hitboxes are encoded into the model DMX,
-            # so their standalone .qci export buttons are dead-ends - hide them. Procedural
-            # bones still export as a .vrd, so they stay.
             if prefab_mode_is_dme(context.scene):
-                allowed -= {'JIGGLEBONES', 'ATTACHMENTS', 'HITBOXES'}
+                allowed -= _DME_ENCODED_PREFABS
 
             entries = [(t, c) for t, c in available if t in allowed]
             if entries:
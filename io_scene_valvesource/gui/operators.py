@@ -1083,8 +1083,12 @@ class SMD_OT_AssignBoneRotExportOffset(Operator):
 
     @classmethod
     def poll(cls, context) -> bool:
-        selected_arms = [ob for ob in context.selected_objects if is_armature(ob)]
-        return bool(selected_arms and context.mode not in {'EDIT', 'EDIT_ARMATURE', 'OBJECT'} and context.active_bone and context.active_bone.select == True)
+        if context.mode in {'EDIT', 'EDIT_ARMATURE', 'OBJECT'}:
+            return False
+        active_bone = context.active_bone
+        if not (active_bone and active_bone.select):
+            return False
+        return any(is_armature(ob) for ob in context.selected_objects)
 
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
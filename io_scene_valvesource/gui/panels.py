@@ -6,7 +6,7 @@ from ..utils import (get_id, State, Compiler, ExportFormat, is_armature, is_mesh
                      is_curve, is_mesh_compatible, modifier_compatible, vertex_maps, vertex_float_maps,
                      cloth_map_groups, hasFlexControllerSource, get_armature, countShapes,
                      MakeObjectIcon, get_active_exportable, get_valid_vertexanimation_object,
-                     get_bone_exportname,
+                     get_bone_exportname, get_bone_exportnames,
                      sanitize_string_for_delta, _build_dme_ctrl_names, _build_stereo_delta_names,
                      get_dme_renamed_delta_names, get_dme_delta_override_conflicts,
                      get_dme_split_delta_conflicts)
@@ -40,6 +40,18 @@ from .operators import (
     SMD_OT_SelectVertexFloatMap_idname,
 )
 
+# Button labels for the cloth float maps; the map list is static, so format them once
+# instead of on every redraw of SMD_PT_Vertexfloatmap.
+_cloth_map_labels = {name: name.replace("cloth_", "").replace("_", " ").title() for name in vertex_float_maps}
+
+# Base spring side constraints drawn by SMD_PT_Jigglebones:
+# (toggle prop, direction used in the jiggle_<dir>_* limit props, limits label id).
+_BASESPRING_CONSTRAINTS = (
+    ('jiggle_has_left_constraint',    'left',    'label_side_limits'),
+    ('jiggle_has_up_constraint',      'up',      'label_up_limits'),
+    ('jiggle_has_forward_constraint', 'forward', 'label_forward_limits'),
+)
+
 
 class Properties_Panel(Panel):
     bl_label = 'sample_propertiessub'
@@ -435,7 +447,7 @@ class SMD_PT_Hitboxes(Properties_Panel):
             split.label(text=get_id('prop_hitbox_vec_max') + ":")
             split.row(align=True).prop(entry, 'vec_max', text='')
 
-            if not is_capsule and any(entry.vec_min[i] > entry.vec_max[i] for i in range(3)):
+            if not is_capsule and any(lo > hi for lo, hi in zip(entry.vec_min, entry.vec_max)):
                 box.label(text="Min > Max : inverted box, swap Min and Max", icon='ERROR')
 
             box.prop(entry, 'rotation', text=get_id('prop_hitbox_rotation'))
@@ -568,12 +580,16 @@ class SMD_PT_BoneData(Properties_Panel):
         box = layout.box()
         col = box.column(align=True)
 
-        if isinstance(active_bone, PoseBone):
-            active_bone_vs = active_bone.bone.vs
-        else:
-            active_bone_vs = active_bone.vs
+        data_bone = active_bone.bone if isinstance(active_bone, PoseBone) else active_bone
+        active_bone_vs = data_bone.vs
 
-        active_bone_exportname = get_bone_exportname(active_bone)
+        # The panel usually already knows the armature; get_bone_exportname would look it up
+        # again by scanning every object in the file. A pinned Properties editor can show a
+        # different armature than the one owning the active bone, so fall back in that case.
+        if active_object.data == data_bone.id_data:
+            active_bone_exportname = get_bone_exportnames(active_object)[data_bone.name]
+        else:
+            active_bone_exportname = get_bone_exportname(active_bone)
         col.prop(active_bone.vs, 'export_name', placeholder=active_bone_exportname, text='')
         col.separator()
         col.prop(active_bone.vs, 'bone_sort_order', slider=True)
@@ -629,8 +645,6 @@ class SMD_PT_Jigglebones(Properties_Panel):
 
     def draw(self, context):
         layout = self.layout
-        active_object = context.object
-        active_armature = get_armature(active_object)
         active_bone = context.active_bone
 
         box = layout.box()
@@ -653,22 +667,21 @@ class SMD_PT_Jigglebones(Properties_Panel):
 
     def draw_jigglebone_properties(self, layout: UILayout, bone: Bone) -> None:
         vs_bone = bone.vs
+        is_jigglebone = vs_bone.bone_is_jigglebone
 
-        box = layout
-        row = box.row()
+        row = layout.row()
         row.prop(
             vs_bone, 'bone_is_jigglebone',
             toggle=True,
-            icon='DOWNARROW_HLT' if vs_bone.bone_is_jigglebone else 'RIGHTARROW',
+            icon='DOWNARROW_HLT' if is_jigglebone else 'RIGHTARROW',
             text=f'{bone.name}',
             emboss=True
         )
 
-        if not vs_bone.bone_is_jigglebone:
+        if not is_jigglebone:
             return
 
-        box = layout
-        col = box.column(align=False)
+        col = layout.column(align=False)
 
         col.label(text=get_id('label_jiggle_type', format_string=True), icon='DRIVER')
         subcol = col.column(align=True)
@@ -708,7 +721,7 @@ class SMD_PT_Jigglebones(Properties_Panel):
         col.prop(vs_bone, 'jiggle_collision_point1')
 
     def _draw_flexible_rigid_props(self, layout: UILayout, vs_bone) -> None:
-        if vs_bone.jiggle_flex_type not in ['FLEXIBLE', 'RIGID']:
+        if vs_bone.jiggle_flex_type not in ('FLEXIBLE', 'RIGID'):
             return
 
         box = layout.box()
@@ -728,8 +741,6 @@ class SMD_PT_Jigglebones(Properties_Panel):
             subcol = col.column(align=True)
             subcol.prop(vs_bone, 'jiggle_yaw_stiffness', slider=True)
             subcol.prop(vs_bone, 'jiggle_yaw_damping', slider=True)
-
-            subcol = col.column(align=True)
             subcol.prop(vs_bone, 'jiggle_pitch_stiffness', slider=True)
             subcol.prop(vs_bone, 'jiggle_pitch_damping', slider=True)
 
@@ -754,22 +765,21 @@ class SMD_PT_Jigglebones(Properties_Panel):
         row.prop(vs_bone, 'jiggle_has_yaw_constraint', toggle=True, text=get_id('label_yaw', format_string=True))
         row.prop(vs_bone, 'jiggle_has_pitch_constraint', toggle=True, text=get_id('label_pitch', format_string=True))
 
-        has_any = any([
-            vs_bone.jiggle_has_angle_constraint,
-            vs_bone.jiggle_has_yaw_constraint,
-            vs_bone.jiggle_has_pitch_constraint])
+        has_angle = vs_bone.jiggle_has_angle_constraint
+        has_yaw = vs_bone.jiggle_has_yaw_constraint
+        has_pitch = vs_bone.jiggle_has_pitch_constraint
 
-        if not has_any:
+        if not (has_angle or has_yaw or has_pitch):
             return
 
         col.separator(factor=0.3)
 
-        if vs_bone.jiggle_has_angle_constraint:
+        if has_angle:
             subcol = col.column(align=True)
             subcol.prop(vs_bone, 'jiggle_angle_constraint')
             col.separator(factor=0.3)
 
-        if vs_bone.jiggle_has_yaw_constraint:
+        if has_yaw:
             subcol = col.column(align=False)
             subcol.label(text=get_id('label_yaw_limits', format_string=True), icon='EMPTY_SINGLE_ARROW')
             row = subcol.row(align=True)
@@ -778,7 +788,7 @@ class SMD_PT_Jigglebones(Properties_Panel):
             subcol.prop(vs_bone, 'jiggle_yaw_friction', slider=True, text=get_id('label_friction', format_string=True))
             col.separator(factor=0.3)
 
-        if vs_bone.jiggle_has_pitch_constraint:
+        if has_pitch:
             subcol = col.column(align=False)
             subcol.label(text=get_id('label_pitch_limits', format_string=True), icon='EMPTY_SINGLE_ARROW')
             row = subcol.row(align=True)
@@ -803,32 +813,22 @@ class SMD_PT_Jigglebones(Properties_Panel):
         row.prop(vs_bone, 'jiggle_has_up_constraint', toggle=True, text=get_id('label_up', format_string=True))
         row.prop(vs_bone, 'jiggle_has_forward_constraint', toggle=True, text=get_id('label_forward', format_string=True))
 
-        has_any = any([
-            vs_bone.jiggle_has_left_constraint,
-            vs_bone.jiggle_has_up_constraint,
-            vs_bone.jiggle_has_forward_constraint
-        ])
+        enabled = [(direction, limits_key) for has_prop, direction, limits_key in _BASESPRING_CONSTRAINTS
+                   if getattr(vs_bone, has_prop)]
 
-        if not has_any:
+        if not enabled:
             return
 
         col.separator(factor=0.3)
 
-        constraint_props = [
-            (vs_bone.jiggle_has_left_constraint,    'left',    'label_side_limits'),
-            (vs_bone.jiggle_has_up_constraint,      'up',      'label_up_limits'),
-            (vs_bone.jiggle_has_forward_constraint, 'forward', 'label_forward_limits'),
-        ]
-
-        for has_constraint, direction, limits_key in constraint_props:
-            if has_constraint:
-                subcol = col.column(align=False)
-                subcol.label(text=get_id(limits_key, format_string=True), icon='EMPTY_SINGLE_ARROW')
-                row = subcol.row(align=True)
-                row.prop(vs_bone, f'jiggle_{direction}_constraint_min', slider=True, text=get_id('label_min', format_string=True))
-                row.prop(vs_bone, f'jiggle_{direction}_constraint_max', slider=True, text=get_id('label_max', format_string=True))
-                subcol.prop(vs_bone, f'jiggle_{direction}_friction', slider=True, text=get_id('label_friction', format_string=True))
-                col.separator(factor=0.3)
+        for direction, limits_key in enabled:
+            subcol = col.column(align=False)
+            subcol.label(text=get_id(limits_key, format_string=True), icon='EMPTY_SINGLE_ARROW')
+            row = subcol.row(align=True)
+            row.prop(vs_bone, f'jiggle_{direction}_constraint_min', slider=True, text=get_id('label_min', format_string=True))
+            row.prop(vs_bone, f'jiggle_{direction}_constraint_max', slider=True, text=get_id('label_max', format_string=True))
+            subcol.prop(vs_bone, f'jiggle_{direction}_friction', slider=True, text=get_id('label_friction', format_string=True))
+            col.separator(factor=0.3)
 
     def _draw_boing_props(self, layout: UILayout, vs_bone) -> None:
         box = layout.box()
@@ -904,16 +904,19 @@ class SMD_PT_Shapekey(Properties_Panel):
             return
 
         num_shapes, num_correctives = countShapes(active_object)
+        scvs = context.scene.vs
+        ob_vs = active_object.vs
+        data_vs = active_object.data.vs
 
         box = layout.box()
         col = box.column()
-        col.prop(active_object.data.vs, "bake_shapekey_as_basis_normals")
-        col.prop(active_object.data.vs, "normalize_shapekeys")
+        col.prop(data_vs, "bake_shapekey_as_basis_normals")
+        col.prop(data_vs, "normalize_shapekeys")
 
         col = box.column()
         col.scale_y = 1.2
         row = col.row(align=True)
-        row.prop(active_object.vs,"flex_controller_mode",expand=True)
+        row.prop(ob_vs,"flex_controller_mode",expand=True)
 
         def insertCorrectiveUi(parent):
             col = parent.column(align=True)
@@ -931,18 +934,18 @@ class SMD_PT_Shapekey(Properties_Panel):
             r.label(text=active_object.data.name + ":",icon=MakeObjectIcon(active_object,suffix='_DATA'),translate=False) # type: ignore
             r2 = r.split(factor=0.7,align=True)
 
-            if active_object.data.vs.flex_stereo_mode == 'VGROUP':
-                r2.alert = active_object.vertex_groups.get(active_object.data.vs.flex_stereo_vg) is None
-                r2.prop_search(active_object.data.vs,"flex_stereo_vg",active_object,"vertex_groups",text="")
+            if data_vs.flex_stereo_mode == 'VGROUP':
+                r2.alert = active_object.vertex_groups.get(data_vs.flex_stereo_vg) is None
+                r2.prop_search(data_vs,"flex_stereo_vg",active_object,"vertex_groups",text="")
             else:
-                r2.prop(active_object.data.vs,"flex_stereo_sharpness",text="Sharpness")
+                r2.prop(data_vs,"flex_stereo_sharpness",text="Sharpness")
 
-            r2.prop(active_object.data.vs,"flex_stereo_mode",text="")
+            r2.prop(data_vs,"flex_stereo_mode",text="")
 
-        if active_object.vs.flex_controller_mode == 'ADVANCED':
+        if ob_vs.flex_controller_mode == 'ADVANCED':
             controller_source = col.row()
-            controller_source.alert = hasFlexControllerSource(active_object.vs.flex_controller_source) == False
-            controller_source.prop(active_object.vs,"flex_controller_source",text=get_id("exportables_flex_src"),icon = 'TEXT' if active_object.vs.flex_controller_source in bpy.data.texts else 'NONE')
+            controller_source.alert = hasFlexControllerSource(ob_vs.flex_controller_source) == False
+            controller_source.prop(ob_vs,"flex_controller_source",text=get_id("exportables_flex_src"),icon = 'TEXT' if ob_vs.flex_controller_source in bpy.data.texts else 'NONE')
 
             row = col.row(align=True)
             row.operator(DmxWriteFlexControllers.bl_idname,icon='TEXT',text=get_id("exportables_flex_generate", True))
@@ -952,26 +955,26 @@ class SMD_PT_Shapekey(Properties_Panel):
 
             insertStereoSplitUi(col)
 
-        elif active_object.vs.flex_controller_mode == 'DME':
+        elif ob_vs.flex_controller_mode == 'DME':
             if State.exportFormat != ExportFormat.DMX:
                 info_row = box.row()
                 info_row.label(text=get_id("warn_dme_dmx_only_panel"), icon='INFO')
 
             # --- Flex Controllers ---
             ctrl_header = box.row()
-            ctrl_header.prop(context.scene.vs, "show_flex_items",
-                             icon='TRIA_DOWN' if context.scene.vs.show_flex_items else 'TRIA_RIGHT',
+            ctrl_header.prop(scvs, "show_flex_items",
+                             icon='TRIA_DOWN' if scvs.show_flex_items else 'TRIA_RIGHT',
                              icon_only=True, emboss=False)
             ctrl_header.label(text=get_id("label_dme_flex_controllers"), icon='SHAPEKEY_DATA')
 
-            if context.scene.vs.show_flex_items:
+            if scvs.show_flex_items:
                 ctrl_col = box.column()
                 ctrl_row = ctrl_col.row()
                 ctrl_list_col = ctrl_row.column()
                 ctrl_list_col.template_list(
                     "SMD_UL_DmeFlexControllers", "",
-                    active_object.vs, "dme_flexcontrollers",
-                    active_object.vs, "dme_flexcontrollers_index",
+                    ob_vs, "dme_flexcontrollers",
+                    ob_vs, "dme_flexcontrollers_index",
                 )
                 ctrl_btn_col = ctrl_row.column(align=True)
                 ctrl_btn_col.operator(SMD_OT_AddFlexController.bl_idname, icon='ADD', text='')
@@ -984,9 +987,9 @@ class SMD_PT_Shapekey(Properties_Panel):
                 down = ctrl_btn_col.operator(SMD_OT_MoveFlexController.bl_idname, icon='TRIA_DOWN', text='')
                 down.direction = 'DOWN'
 
-                idx = active_object.vs.dme_flexcontrollers_index
-                if len(active_object.vs.dme_flexcontrollers) > 0 and idx != -1:
-                    item = active_object.vs.dme_flexcontrollers[idx]
+                idx = ob_vs.dme_flexcontrollers_index
+                if len(ob_vs.dme_flexcontrollers) > 0 and idx != -1:
+                    item = ob_vs.dme_flexcontrollers[idx]
                     ctrl_col.separator(factor=0.5)
                     item_col = ctrl_col.column(align=True)
 
@@ -1034,8 +1037,8 @@ class SMD_PT_Shapekey(Properties_Panel):
 
             # --- Flex Rules & Domination ---
             rules_header = box.row()
-            rules_header.prop(context.scene.vs, "show_flex_rules_items",
-                              icon='TRIA_DOWN' if context.scene.vs.show_flex_rules_items else 'TRIA_RIGHT',
+            rules_header.prop(scvs, "show_flex_rules_items",
+                              icon='TRIA_DOWN' if scvs.show_flex_rules_items else 'TRIA_RIGHT',
                               icon_only=True, emboss=False)
             rules_header.label(text=get_id("label_dme_flex_rules"), icon='DRIVER')
             rule_err_count = _count_flex_rule_errors(active_object)
@@ -1044,14 +1047,14 @@ class SMD_PT_Shapekey(Properties_Panel):
                 err_label.alert = True
                 err_label.label(text=str(rule_err_count), icon='ERROR')
 
-            if context.scene.vs.show_flex_rules_items:
+            if scvs.show_flex_rules_items:
                 rules_col = box.column()
                 rules_row = rules_col.row()
                 rules_list_col = rules_row.column()
                 rules_list_col.template_list(
                     "SMD_UL_DmeFlexRules", "",
-                    active_object.vs, "dme_flex_rules",
-                    active_object.vs, "dme_flex_rules_index",
+                    ob_vs, "dme_flex_rules",
+                    ob_vs, "dme_flex_rules_index",
                 )
                 rules_btn_col = rules_row.column(align=True)
                 rules_btn_col.operator(SMD_OT_AddFlexRule.bl_idname, icon='ADD', text='')
@@ -1066,9 +1069,9 @@ class SMD_PT_Shapekey(Properties_Panel):
                 rules_btn_col.separator()
                 rules_btn_col.operator(SMD_OT_ClearFlexRules.bl_idname, icon='TRASH', text='')
 
-                ridx = active_object.vs.dme_flex_rules_index
-                if len(active_object.vs.dme_flex_rules) > 0 and ridx != -1:
-                    rule = active_object.vs.dme_flex_rules[ridx]
+                ridx = ob_vs.dme_flex_rules_index
+                if len(ob_vs.dme_flex_rules) > 0 and ridx != -1:
+                    rule = ob_vs.dme_flex_rules[ridx]
                     rules_col.separator(factor=0.5)
                     rule_col = rules_col.column(align=True)
 
@@ -1133,12 +1136,12 @@ class SMD_PT_Shapekey(Properties_Panel):
                         expr = rule.expression.strip()
                         if expr:
                             sk_names = set(active_object.data.shape_keys.key_blocks.keys()) if active_object.data.shape_keys else set()
-                            ctrl_names = _build_dme_ctrl_names(active_object.vs)
+                            ctrl_names = _build_dme_ctrl_names(ob_vs)
                             localvar_names = set(
-                                r.name for r in active_object.vs.dme_flex_rules
+                                r.name for r in ob_vs.dme_flex_rules
                                 if r.rule_type == 'LOCALVAR' and r.name
                             )
-                            stereo_delta_names = _build_stereo_delta_names(active_object.vs)
+                            stereo_delta_names = _build_stereo_delta_names(ob_vs)
                             renamed_delta_names = get_dme_renamed_delta_names(active_object)
                             delta_errs, ctrl_errs = validate_flex_expression(expr, sk_names, ctrl_names, localvar_names, stereo_delta_names, renamed_delta_names)
                             if not delta_errs and not ctrl_errs:
@@ -1155,8 +1158,8 @@ class SMD_PT_Shapekey(Properties_Panel):
 
             # --- Delta Name Overrides ---
             ov_header = box.row()
-            ov_header.prop(context.scene.vs, "show_flex_delta_overrides",
-                           icon='TRIA_DOWN' if context.scene.vs.show_flex_delta_overrides else 'TRIA_RIGHT',
+            ov_header.prop(scvs, "show_flex_delta_overrides",
+                           icon='TRIA_DOWN' if scvs.show_flex_delta_overrides else 'TRIA_RIGHT',
                            icon_only=True, emboss=False)
             ov_header.label(text="Delta Map", icon='SORTALPHA')
             ov_conflicts = get_dme_delta_override_conflicts(active_object)
@@ -1165,14 +1168,14 @@ class SMD_PT_Shapekey(Properties_Panel):
                 ov_err.alert = True
                 ov_err.label(text=str(len(ov_conflicts)), icon='ERROR')
 
-            if context.scene.vs.show_flex_delta_overrides:
+            if scvs.show_flex_delta_overrides:
                 ov_col = box.column()
                 ov_row = ov_col.row()
                 ov_list_col = ov_row.column()
                 ov_list_col.template_list(
                     "SMD_UL_DmeDeltaOverrides", "",
-                    active_object.vs, "dme_delta_overrides",
-                    active_object.vs, "dme_delta_overrides_index",
+                    ob_vs, "dme_delta_overrides",
+                    ob_vs, "dme_delta_overrides_index",
                 )
                 ov_btn_col = ov_row.column(align=True)
                 ov_btn_col.operator(SMD_OT_AddDeltaOverride.bl_idname, icon='ADD', text='')
@@ -1180,9 +1183,9 @@ class SMD_PT_Shapekey(Properties_Panel):
                 ov_btn_col.separator()
                 ov_btn_col.operator(SMD_OT_ClearDeltaOverrides.bl_idname, icon='TRASH', text='')
 
-                ovidx = active_object.vs.dme_delta_overrides_index
-                if len(active_object.vs.dme_delta_overrides) > 0 and ovidx != -1:
-                    ov_item = active_object.vs.dme_delta_overrides[ovidx]
+                ovidx = ob_vs.dme_delta_overrides_index
+                if len(ob_vs.dme_delta_overrides) > 0 and ovidx != -1:
+                    ov_item = ob_vs.dme_delta_overrides[ovidx]
                     ov_col.separator(factor=0.5)
                     ov_detail = ov_col.column(align=True)
 
@@ -1301,7 +1304,7 @@ class SMD_PT_Vertexfloatmap(Properties_Panel):
 
             # Render each map in the group
             for map_name in group_maps:
-                display_name = map_name.replace("cloth_", "").replace("_", " ").title()
+                display_name = _cloth_map_labels[map_name]
                 remap = existing_remaps.get(map_name)
 
                 split = group_col.split(align=True, factor=0.5)
@@ -159,17 +159,14 @@ class SMD_UL_DmeFlexRules(UIList):
         row.label(text="", icon=type_icon)
 
         sk = ob.data.shape_keys if (ob.data and hasattr(ob.data, 'shape_keys')) else None
-        sk_names = set(sk.key_blocks.keys()) if sk else set()
-        ctrl_names = _build_dme_ctrl_names(ob.vs)
-        localvar_names = {r.name for r in ob.vs.dme_flex_rules if r.rule_type == 'LOCALVAR' and r.name}
-        stereo_delta_names = _build_stereo_delta_names(ob.vs)
-        renamed_delta_names = get_dme_renamed_delta_names(ob)
 
+        # The name sets below are only built in the branches that validate against them;
+        # DOMINATION and LOCALVAR rows need none, PASSTHROUGH only the controller names.
         has_error = False
 
         if item.rule_type == 'CORRECTIVE':
             comp_str = item.components.strip()
-            has_error = not comp_str or bool(validate_corrective_components(comp_str, sk_names))
+            has_error = not comp_str or bool(validate_corrective_components(comp_str, set(sk.key_blocks.keys()) if sk else set()))
             name_row = row.row(align=True)
             name_row.alert = has_error
             name_row.label(text=item.components if item.components else "(no components)")
@@ -188,9 +185,12 @@ class SMD_UL_DmeFlexRules(UIList):
         else:
             name_alert = False
             if item.rule_type == 'PASSTHROUGH':
-                name_alert = not item.name or item.name not in ctrl_names
+                name_alert = not item.name or item.name not in _build_dme_ctrl_names(ob.vs)
                 has_error = name_alert
             elif item.rule_type == 'EXPRESSION':
+                localvar_names = {r.name for r in ob.vs.dme_flex_rules if r.rule_type == 'LOCALVAR' and r.name}
+                stereo_delta_names = _build_stereo_delta_names(ob.vs)
+                renamed_delta_names = get_dme_renamed_delta_names(ob)
                 if not item.name:
                     name_alert = True
                 else:
@@ -204,6 +204,8 @@ class SMD_UL_DmeFlexRules(UIList):
                 if name_alert:
                     has_error = True
                 elif item.expression:
+                    sk_names = set(sk.key_blocks.keys()) if sk else set()
+                    ctrl_names = _build_dme_ctrl_names(ob.vs)
                     d_errs, c_errs = validate_flex_expression(item.expression.strip(), sk_names, ctrl_names, localvar_names, stereo_delta_names, renamed_delta_names)
                     has_error = bool(d_errs or c_errs)
             elif item.rule_type == 'LOCALVAR':
@@ -305,7 +307,7 @@ class SMD_UL_Hitboxes(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         row = layout.row(align=True)
         is_capsule = item.scale >= 0
-        is_inverted = not is_capsule and any(item.vec_min[i] > item.vec_max[i] for i in range(3))
+        is_inverted = not is_capsule and any(lo > hi for lo, hi in zip(item.vec_min, item.vec_max))
         shape_icon = 'META_CAPSULE' if is_capsule else 'MESH_CUBE'
         row.label(text='', icon=shape_icon)
         row.label(text=item.bone_name if item.bone_name else '—', icon='BONE_DATA')
@@ -319,22 +321,24 @@ class SMD_UL_Hitboxes(UIList):
 
 class SMD_UL_ArmatureItems(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
-        arm = get_armature(context.object)
+        # data is the armature's vs property group, so its owning Armature is at hand
+        # without resolving one from context.object for every row.
+        arm_data = data.id_data
         if active_propname == 'arm_attachment_index':
             obj = item.obj
             if obj:
                 row = layout.row(align=True)
                 row.label(text=obj.name, icon='EMPTY_DATA')
-                if arm:
-                    row.prop_search(obj, 'parent_bone', arm.data, 'bones', text='')
+                row.prop_search(obj, 'parent_bone', arm_data, 'bones', text='')
         else:  # arm_jigglebone_index
-            bone = arm.data.bones.get(item.bone_name) if arm else None
+            bone = arm_data.bones.get(item.bone_name)
             row = layout.row(align=True)
             row.label(text=item.bone_name or '?', icon='BONE_DATA')
             if bone:
-                count = len(bone.collections)
+                bone_collections = bone.collections
+                count = len(bone_collections)
                 if count == 1:
-                    row.label(text=bone.collections[0].name, icon='GROUP_BONE')
+                    row.label(text=bone_collections[0].name, icon='GROUP_BONE')
                 elif count > 1:
                     row.label(text=get_id('label_in_multiple_collection', format_string=True), icon='GROUP_BONE')
                 else:
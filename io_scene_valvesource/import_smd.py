@@ -18,7 +18,7 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
-import bpy, bmesh, random, collections, os
+import bpy, bmesh, random, collections, copy, os
 from bpy import ops
 from bpy.app.translations import pgettext
 from bpy.props import StringProperty, CollectionProperty, BoolProperty, EnumProperty
@@ -37,6 +37,17 @@ from .utils import KST_ATTACHMENT_COLL as _KST_ATTACHMENT_COLL, ensure_kst_colle
 # DEFAULT and CUSTOM are deliberately excluded - they are never produced by a direct match.
 _VALID_FLEXGROUP_ENUMS = {'EYES', 'EYELID', 'BROW', 'MOUTH', 'MISC', 'CHEEK'}
 
+# Lowercased extensions (with the leading dot) routed to readQC, and the subset that
+# readQC hands to the KV3 VMDL importer.
+_VMDL_EXTENSIONS = frozenset({'.vmdl', '.vmdl_prefab'})
+_QC_EXTENSIONS = frozenset({'.qc', '.qci'}) | _VMDL_EXTENSIONS
+
+# Parsed VMDL documents keyed by (path, mtime_ns, size), so re-importing an unchanged
+# file skips the read and the KV3 parse. Least recently used entries are evicted first.
+# The cached documents are never handed out; every import gets its own deep copy.
+_vmdl_doc_cache: dict[tuple, keyvalues3.KVDocument] = {}
+_VMDL_DOC_CACHE_SIZE = 8
+
 
 def _set_flexgroup_from_qc(item, fc_type: str) -> None:
     """Map a QC flexcontroller type keyword onto a FlexControllerItem's flexgroup.
@@ -258,18 +269,18 @@ class SmdImporter(bpy.types.Operator, Logger):
         self.imported_hitboxes = 0
 
         for filepath in [os.path.join(self.directory, file.name) for file in self.files] if self.files else [self.filepath]:
-            filepath_lc = filepath.lower()
-            if filepath_lc.endswith(('.qc', '.qci', '.vmdl', '.vmdl_prefab')):
+            ext = os.path.splitext(filepath)[1].lower()
+            if ext in _QC_EXTENSIONS:
                 self.num_files_imported = self.readQC(filepath, False, self.properties.doAnim, self.properties.makeCamera, self.properties.rotMode, outer_qc=True)
                 bpy.context.view_layer.objects.active = self.qc.a
-            elif filepath_lc.endswith('.smd'):
+            elif ext == '.smd':
                 self.num_files_imported = self.readSMD(filepath, self.properties.upAxis, self.properties.rotMode)
-            elif filepath_lc.endswith('.vta'):
+            elif ext == '.vta':
                 self.num_files_imported = self.readSMD(filepath, self.properties.upAxis, self.properties.rotMode, smd_type=FLEX)
-            elif filepath_lc.endswith('.dmx'):
+            elif ext == '.dmx':
                 self.num_files_imported = self.readDMX(filepath, self.properties.upAxis, self.properties.rotMode)
             else:
-                if len(filepath_lc) == 0:
+                if not filepath:
                     self.report({'ERROR'}, get_id("importer_err_nofile"))
                 else:
                     self.report({'ERROR'}, get_id("importer_err_badfile", True).format(os.path.basename(filepath)))
@@ -588,8 +599,7 @@ class SmdImporter(bpy.types.Operator, Logger):
         if self.append != 'VALIDATE' and smd.jobType in [REF, ANIM] and not self.appliedReferencePose:
             self.appliedReferencePose = True
 
-            for bone in smd.a.pose.bones:
-                bone.matrix_basis.identity()
+            reset_pose_bones(smd.a)
             for bone, kf in keyframes.items():
                 if bone.name in self.existingBones:
                     continue
@@ -602,13 +612,15 @@ class SmdImporter(bpy.types.Operator, Logger):
             bone_vis = None if self.properties.boneMode == 'NONE' else bpy.data.objects.get("smd_bone_vis")
 
             if self.properties.boneMode == 'SPHERE' and (not bone_vis or bone_vis.type != 'MESH'):
-                ops.mesh.primitive_ico_sphere_add(subdivisions=3, radius=2)
-                bone_vis = bpy.context.active_object
-                bone_vis.data.name = bone_vis.name = "smd_bone_vis"
+                # Build the sphere directly; it is never linked to a collection, so there is
+                # no need to go through the add-primitive operator and undo its scene changes.
+                bm = bmesh.new()
+                bmesh.ops.create_icosphere(bm, subdivisions=3, radius=2)
+                vis_mesh = bpy.data.meshes.new("smd_bone_vis")
+                bm.to_mesh(vis_mesh)
+                bm.free()
+                bone_vis = bpy.data.objects.new("smd_bone_vis", vis_mesh)
                 bone_vis.use_fake_user = True
-                for collection in bone_vis.users_collection:
-                    collection.objects.unlink(bone_vis)
-                bpy.context.view_layer.objects.active = smd.a
             elif self.properties.boneMode == 'ARROWS' and (not bone_vis or bone_vis.type != 'EMPTY'):
                 bone_vis = bpy.data.objects.new("smd_bone_vis", None)
                 bone_vis.use_fake_user = True
@@ -676,6 +688,12 @@ class SmdImporter(bpy.types.Operator, Logger):
                     bone_string = f"pose.bones[\"{bone.name}\"]."
                     group = groups.new(name=bone.name)
 
+                    # Flattened (frame, value) pairs per curve channel; each curve gets them
+                    # in one add() + foreach_set() below instead of growing one key at a time.
+                    cosLoc = [[] for _ in range(3)]
+                    cosRot = [[] for _ in range(4)]
+                    cosScale = [[] for _ in range(3)]
+
                     for keyframe in keys:
                         if bone.parent:
                             parentMat = bone.parent.matrix
@@ -690,9 +708,9 @@ class SmdImporter(bpy.types.Operator, Logger):
                                     curve = fcurves.new(data_path=bone_string + "location", index=i)
                                     curve.group = group
                                     curvesLoc.append(curve)
+                            location = bone.location
                             for i in range(3):
-                                curvesLoc[i].keyframe_points.add(1)
-                                curvesLoc[i].keyframe_points[-1].co = [keyframe.frame, bone.location[i]]
+                                cosLoc[i] += (keyframe.frame, location[i])
 
                         if keyframe.rot:
                             if curvesRot is None:
@@ -704,14 +722,9 @@ class SmdImporter(bpy.types.Operator, Logger):
                                     )
                                     curve.group = group
                                     curvesRot.append(curve)
-                            if smd.rotMode == 'XYZ':
-                                for i in range(3):
-                                    curvesRot[i].keyframe_points.add(1)
-                                    curvesRot[i].keyframe_points[-1].co = [keyframe.frame, bone.rotation_euler[i]]
-                            else:
-                                for i in range(4):
-                                    curvesRot[i].keyframe_points.add(1)
-                                    curvesRot[i].keyframe_points[-1].co = [keyframe.frame, bone.rotation_quaternion[i]]
+                            rotation = bone.rotation_euler if smd.rotMode == 'XYZ' else bone.rotation_quaternion
+                            for i in range(len(curvesRot)):
+                                cosRot[i] += (keyframe.frame, rotation[i])
 
                         if keyframe.scale:
                             if curvesScale is None:
@@ -720,9 +733,16 @@ class SmdImporter(bpy.types.Operator, Logger):
                                     curve = fcurves.new(data_path=bone_string + "scale", index=i)
                                     curve.group = group
                                     curvesScale.append(curve)
+                            scale = bone.scale
                             for i in range(3):
-                                curvesScale[i].keyframe_points.add(1)
-                                curvesScale[i].keyframe_points[-1].co = [keyframe.frame, bone.scale[i]]
+                                cosScale[i] += (keyframe.frame, scale[i])
+
+                    for curves, channel_cos in ((curvesLoc, cosLoc), (curvesRot, cosRot), (curvesScale, cosScale)):
+                        if curves is None:
+                            continue
+                        for curve, cos in zip(curves, channel_cos):
+                            curve.keyframe_points.add(len(cos) // 2)
+                            curve.keyframe_points.foreach_set("co", cos)
 
                 for child in bone.children:
                     ApplyRecursive(child)
@@ -942,12 +962,22 @@ class SmdImporter(bpy.types.Operator, Logger):
             smd.m.active_shape_key_index = 0
         smd.m.show_only_shape_key = True
 
-        def vec_round(v):
-            return Vector([round(co, 3) for co in v])
+        def vertex_cos(verts) -> list[tuple[float, float, float]]:
+            cos = [0.0] * (len(verts) * 3)
+            verts.foreach_get("co", cos)
+            return list(zip(cos[0::3], cos[1::3], cos[2::3]))
+
+        def co_round(co):
+            return (round(co[0], 3), round(co[1], 3), round(co[2], 3))
 
+        # Index the target mesh's vertex positions once so each VTA vertex is matched
+        # with a dict lookup rather than a linear search. setdefault keeps the first
+        # vertex at a position, which is the one list.index() used to return.
         co_map: dict[int, int] = {}
-        mesh_cos = [vert.co for vert in smd.m.data.vertices]
-        mesh_cos_rnd = None
+        mesh_co_index: dict[tuple, int] = {}
+        for i, co in enumerate(vertex_cos(smd.m.data.vertices)):
+            mesh_co_index.setdefault(co, i)
+        mesh_co_rnd_index = None
 
         smd.vta_ref = None
         vta_cos = []
@@ -956,7 +986,16 @@ class SmdImporter(bpy.types.Operator, Logger):
         making_base_shape = True
         bad_vta_verts = []
         num_shapes = 0
-        md = smd.m.data
+        up_axis_mat = getUpAxisMat(smd.upAxis)
+
+        # Vertex positions of the shape key being read. They are collected in a flat
+        # buffer and written with one foreach_set when the shape ends.
+        shape_key = None
+        shape_cos: list[float] = []
+
+        def flush_shape():
+            if shape_key is not None:
+                shape_key.data.foreach_set("co", shape_cos)
 
         for line in smd.file:
             line = line.rstrip("\n")
@@ -966,6 +1005,7 @@ class SmdImporter(bpy.types.Operator, Logger):
             values = line.split()
 
             if values[0] == "time":
+                flush_shape()
                 shape_name = smd.shapeNames.get(values[1])
                 if smd.vta_ref is None:
                     if not hasShapes(smd.m, False):
@@ -989,21 +1029,18 @@ class SmdImporter(bpy.types.Operator, Logger):
                     vta_ref.modifiers.remove(mod)
                     del mod
 
-                    for i in range(len(vd.vertices)):
-                        id = vta_ids[i]
-                        co = vd.vertices[i].co
-                        map_id = None
-                        try:
-                            map_id = mesh_cos.index(co)
-                        except ValueError:
-                            if not mesh_cos_rnd:
-                                mesh_cos_rnd = [vec_round(co) for co in mesh_cos]
-                            try:
-                                map_id = mesh_cos_rnd.index(vec_round(co))
-                            except ValueError:
+                    for i, co in enumerate(vertex_cos(vd.vertices)):
+                        map_id = mesh_co_index.get(co)
+                        if map_id is None:
+                            if mesh_co_rnd_index is None:
+                                mesh_co_rnd_index = {}
+                                for mesh_co, mesh_id in mesh_co_index.items():
+                                    mesh_co_rnd_index.setdefault(co_round(mesh_co), mesh_id)
+                            map_id = mesh_co_rnd_index.get(co_round(co))
+                            if map_id is None:
                                 bad_vta_verts.append(i)
                                 continue
-                        co_map[id] = map_id
+                        co_map[vta_ids[i]] = map_id
 
                     bpy.data.meshes.remove(vd)
                     del vd
@@ -1022,24 +1059,26 @@ class SmdImporter(bpy.types.Operator, Logger):
                     making_base_shape = False
 
                 if not making_base_shape:
-                    sk = smd.m.shape_key_add(name=shape_name if shape_name else values[1])
-                    sk.value = 0.0
+                    shape_key = smd.m.shape_key_add(name=shape_name if shape_name else values[1])
+                    shape_key.value = 0.0
+                    shape_cos = [0.0] * (len(shape_key.data) * 3)
+                    shape_key.data.foreach_get("co", shape_cos)
                     num_shapes += 1
 
                 continue
 
             cur_id = int(values[0])
-            vta_co = getUpAxisMat(smd.upAxis) @ Vector([float(values[1]), float(values[2]), float(values[3])])
+            vta_co = up_axis_mat @ Vector([float(values[1]), float(values[2]), float(values[3])])
 
             if making_base_shape:
                 vta_ids.append(cur_id)
                 vta_cos.extend(vta_co)
             else:
-                try:
-                    md.shape_keys.key_blocks[-1].data[co_map[cur_id]].co = vta_co
-                except KeyError:
-                    pass
+                map_id = co_map.get(cur_id)
+                if map_id is not None:
+                    shape_cos[map_id * 3:map_id * 3 + 3] = vta_co
 
+        flush_shape()
         print(f"- Imported {num_shapes} flex shapes")
 
     # -------------------------------------------------------------------------
@@ -1076,8 +1115,7 @@ class SmdImporter(bpy.types.Operator, Logger):
         else:
             qc = self.qc
 
-        filepath_lc = filepath.lower()
-        if filepath_lc.endswith(('.vmdl', '.vmdl_prefab')):
+        if os.path.splitext(filepath)[1].lower() in _VMDL_EXTENSIONS:
             return self._import_vmdl(filepath, qc, rotMode)
 
         try:
@@ -1168,15 +1206,8 @@ class SmdImporter(bpy.types.Operator, Logger):
                         self.warning(get_id("qc_warn_noarmature_hbox", True).format(filename))
                         continue
 
-                prev_pose_position = qc.a.data.pose_position
-                qc.a.data.pose_position = 'REST'
-                bpy.context.view_layer.update()
-
                 created, skipped, bones = import_hitboxes_from_content(line_str, qc.a, bpy.context, self.createCollections, hboxset_name=qc.hboxset_name)
 
-                qc.a.data.pose_position = prev_pose_position
-                bpy.context.view_layer.update()
-
                 if created > 0:
                     self.imported_hitboxes += created
                     print(f"- Imported {created} hitbox(es) from QC")
@@ -1525,7 +1556,7 @@ class SmdImporter(bpy.types.Operator, Logger):
             keywords = getDmxKeywords(dm.format_ver)
 
             correctiveSeparator = '_'
-            if dm.format_ver >= 22 and any([elem for elem in dm.elements if elem.type == "DmeVertexDeltaData" and '__' in elem.name]):
+            if dm.format_ver >= 22 and any(elem for elem in dm.elements if elem.type == "DmeVertexDeltaData" and '__' in elem.name):
                 correctiveSeparator = '__'
                 self._ensureSceneDmxVersion(dmx_version(9, 22, compiler=Compiler.MODELDOC))
 
@@ -2269,17 +2300,33 @@ class SmdImporter(bpy.types.Operator, Logger):
         print(f"\nVMDL IMPORTER: now working on {filename}")
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                vmdl_text = f.read()
+            st = os.stat(filepath)
+            cache_key = (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+            kv_doc = _vmdl_doc_cache.pop(cache_key, None)
+            if kv_doc is None:
+                with open(filepath, 'rb') as f:
+                    vmdl_data = f.read()
         except IOError as e:
             self.error(f"Could not read {filepath}: {e}")
             return 0
 
-        try:
-            kv_doc = keyvalues3.KVParser(vmdl_text).parse()
-        except Exception as e:
-            self.error(f"Failed to parse {filename}: {e}")
-            return 0
+        if kv_doc is None:
+            try:
+                # One decode of the whole file; a bad byte is reported as a parse failure.
+                # Fold CRLF/CR newlines to LF as text mode did, and drop a UTF-8 BOM.
+                vmdl_text = vmdl_data.decode('utf-8-sig').replace('\r\n', '\n').replace('\r', '\n')
+                kv_doc = keyvalues3.KVParser(vmdl_text).parse()
+            except Exception as e:
+                self.error(f"Failed to parse {filename}: {e}")
+                return 0
+
+        # (Re)insert at the end so hits count as recent use.
+        if len(_vmdl_doc_cache) >= _VMDL_DOC_CACHE_SIZE:
+            del _vmdl_doc_cache[next(iter(_vmdl_doc_cache))]
+        _vmdl_doc_cache[cache_key] = kv_doc
+        # Copying keeps the cached tree (and its class index) intact whatever this
+        # import does with the document, and is still cheaper than re-reading and re-parsing.
+        kv_doc = copy.deepcopy(kv_doc)
 
         root_node = kv_doc.roots.get("rootNode")
         if not root_node:
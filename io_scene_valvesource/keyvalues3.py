@@ -21,7 +21,7 @@
 #   SOFTWARE.
 
 import re
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
 
 def _format_value(value: Any, indent: int = 0) -> str:
@@ -125,10 +125,17 @@ class KVHeader:
 
 
 class KVNode:
-    def __init__(self, **kwargs):
-        self.children: list["KVNode"] = []
+    def __init__(self, *, children: "Iterable[KVNode] | None" = None, **kwargs):
+        self.children: list["KVNode"] = list(children) if children is not None else []
         self.properties: dict[str, Any] = kwargs
 
+    @classmethod
+    def from_dict(cls, properties: dict[str, Any], children: "Iterable[KVNode] | None" = None) -> "KVNode":
+        """Build a node that adopts an already-built property dict instead of copying it."""
+        node = cls(children=children)
+        node.properties = properties
+        return node
+
     def add_child(self, child: "KVNode"):
         self.children.append(child)
 
@@ -159,28 +166,33 @@ class KVNode:
         return results
 
     def _serialize(self, indent: int = 0) -> str:
+        return "".join(self._serialize_iter(indent))
+
+    def _serialize_iter(self, indent: int = 0) -> Iterator[str]:
         tab = "\t" * indent
-        out = f"{tab}{{\n"
+        yield f"{tab}{{\n"
 
         for key, value in self.properties.items():
             if isinstance(value, KVNode):
-                out += f"{tab}\t{key} =\n{value._serialize(indent + 1)}\n"
+                yield f"{tab}\t{key} =\n"
+                yield from value._serialize_iter(indent + 1)
+                yield "\n"
             elif isinstance(value, dict):
-                out += f"{tab}\t{key} =\n{tab}\t{{\n"
+                yield f"{tab}\t{key} =\n{tab}\t{{\n"
                 for k2, v2 in value.items():
-                    out += f"{tab}\t\t{k2} = {_format_value(v2, indent + 2)}\n"
-                out += f"{tab}\t}}\n"
+                    yield f"{tab}\t\t{k2} = {_format_value(v2, indent + 2)}\n"
+                yield f"{tab}\t}}\n"
             else:
-                out += f"{tab}\t{key} = {_format_value(value, indent + 1)}\n"
+                yield f"{tab}\t{key} = {_format_value(value, indent + 1)}\n"
 
         if self.children:
-            out += f"{tab}\tchildren =\n{tab}\t[\n"
+            yield f"{tab}\tchildren =\n{tab}\t[\n"
             for child in self.children:
-                out += f"{child._serialize(indent + 2)},\n"
-            out += f"{tab}\t]\n"
+                yield from child._serialize_iter(indent + 2)
+                yield ",\n"
+            yield f"{tab}\t]\n"
 
-        out += f"{tab}}}"
-        return out
+        yield f"{tab}}}"
 
     def __repr__(self):
         props = ", ".join(f"{k}={v!r}" for k, v in self.properties.items())
@@ -195,6 +207,11 @@ class KVDocument:
             format=format, format_version=format_version,
         )
         self.roots: dict[str, KVNode] = {}
+        # _class -> nodes, filled by KVParser with the same nodes, in the same order,
+        # that the stack walk in nodes_of_class would find. Only valid for a parsed
+        # document that has not been modified since: it is reset when the roots
+        # change, but edits to a node's children are not tracked.
+        self.class_index: "dict[str, list[KVNode]] | None" = None
 
     @classmethod
     def from_text(cls, text: str) -> "KVDocument":
@@ -202,16 +219,53 @@ class KVDocument:
 
     def add_root(self, key: str, node: KVNode):
         self.roots[key] = node
+        self.class_index = None
 
     def remove_root(self, key: str) -> bool:
+        self.class_index = None
         return self.roots.pop(key, None) is not None
 
-    def to_text(self) -> str:
-        out = str(self.header) + "\n{\n"
+    def nodes_of_class(self, cls: str) -> list[KVNode]:
+        """Every node whose ``_class`` is ``cls``, in document (pre-)order.
+
+        Only roots and children are searched, not nodes stored as property values.
+        Parsed documents answer from the parser's class index; otherwise the tree
+        is walked with an explicit stack. Callers that edit children of a parsed
+        document must reset ``class_index`` to None before asking again.
+        """
+        if self.class_index is not None:
+            return list(self.class_index.get(cls, ()))
+
+        found = []
+        stack = list(reversed(self.roots.values()))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, KVNode):
+                if node.properties.get("_class") == cls:
+                    found.append(node)
+                stack.extend(reversed(node.children))
+            elif isinstance(node, dict):
+                stack.extend(reversed(node.values()))
+            elif isinstance(node, (list, tuple)):
+                stack.extend(reversed(node))
+        return found
+
+    def iter_text(self) -> Iterator[str]:
+        """Yield the document text in fragments, without building the full string."""
+        yield str(self.header)
+        yield "\n{\n"
         for key, node in self.roots.items():
-            out += f"\t{key} =\n{node._serialize(indent=1)}\n"
-        out += "}\n"
-        return out
+            yield f"\t{key} =\n"
+            yield from node._serialize_iter(indent=1)
+            yield "\n"
+        yield "}\n"
+
+    def to_text(self) -> str:
+        return "".join(self.iter_text())
+
+    def write(self, fp: TextIO) -> None:
+        """Stream the document text into an open text file."""
+        fp.writelines(self.iter_text())
 
     def __repr__(self):
         return f"KVDocument(roots={list(self.roots.keys())})"
@@ -226,6 +280,9 @@ class KVParser:
         self.text = text
         self.pos = 0
         self.length = len(text)
+        # Nodes in root/children positions, in pre-order; a slot is reserved before
+        # a node's body is parsed and filled once the node is built.
+        self._indexed: "list[KVNode | None]" = []
 
     def parse(self) -> KVDocument:
         header_data = self._parse_header()
@@ -238,6 +295,12 @@ class KVParser:
             encoding=header_data.get("encoding"),
         )
         doc.roots = roots
+        class_index: dict[str, list[KVNode]] = {}
+        for node in self._indexed:
+            cls = node.properties.get("_class")
+            if cls is not None:
+                class_index.setdefault(cls, []).append(node)
+        doc.class_index = class_index
         return doc
 
     def _parse_header(self) -> dict:
@@ -265,13 +328,16 @@ class KVParser:
             self._consume_whitespace()
             self._expect("=")
             self._consume_whitespace()
-            roots[key] = self._parse_node()
+            roots[key] = self._parse_node(indexed=True)
         return roots
 
-    def _parse_node(self) -> KVNode:
+    def _parse_node(self, indexed: bool = False) -> KVNode:
         self._expect("{")
         props = {}
         children = []
+        if indexed:
+            slot = len(self._indexed)
+            self._indexed.append(None)
 
         while True:
             self._consume_whitespace()
@@ -282,7 +348,7 @@ class KVParser:
                 break
 
             if c == "{":
-                children.append(self._parse_node())
+                children.append(self._parse_node(indexed=indexed))
                 continue
 
             key = self._parse_identifier()
@@ -293,15 +359,16 @@ class KVParser:
                 self._consume_whitespace()
 
             if key == "children":
-                children = self._parse_children()
+                children = self._parse_children(indexed)
             else:
                 props[key] = self._parse_value()
 
-        node = KVNode(**props)
-        node.children = children
+        node = KVNode.from_dict(props, children)
+        if indexed:
+            self._indexed[slot] = node
         return node
 
-    def _parse_children(self) -> list:
+    def _parse_children(self, indexed: bool = False) -> list:
         self._expect("[")
         children = []
         while True:
@@ -309,7 +376,13 @@ class KVParser:
             if self._peek() == "]":
                 self._advance()
                 break
-            child = self._parse_node() if self._peek() == "{" else self._parse_value()
+            c = self._peek()
+            if c == "{":
+                child = self._parse_node(indexed)
+            elif c == "[":
+                child = self._parse_array(indexed)
+            else:
+                child = self._parse_value()
             children.append(child)
             self._consume_whitespace()
             if self._peek() == ",":
@@ -338,15 +411,22 @@ class KVParser:
             return float(word) if "." in word else int(word)
         return word
 
-    def _parse_array(self) -> list:
+    def _parse_array(self, indexed: bool = False) -> list:
+        # Arrays inside children are walked by nodes_of_class, so their nodes are indexed too.
         self._expect("[")
         values = []
         while True:
             self._consume_whitespace()
-            if self._peek() == "]":
+            c = self._peek()
+            if c == "]":
                 self._advance()
                 break
-            values.append(self._parse_value())
+            if indexed and c == "{":
+                values.append(self._parse_node(indexed))
+            elif indexed and c == "[":
+                values.append(self._parse_array(indexed))
+            else:
+                values.append(self._parse_value())
             self._consume_whitespace()
             if self._peek() == ",":
                 self._advance()
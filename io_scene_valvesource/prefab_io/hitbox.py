@@ -16,7 +16,7 @@ import math
 
 from mathutils import Vector, Euler
 
-from .. import utils, datamodel, keyvalues3
+from .. import utils, datamodel
 from ..keyvalues3 import KVBool, KVVector3
 
 
@@ -41,10 +41,8 @@ def write_dme_attrs(hb, entry, bone_export: str) -> None:
     # orientation is a plain vector3 of Euler degrees (pitch, yaw, roll), read
     # into angOffsetOrientation on the compiler. Vector3 (not Angle) avoids the
     # "angle" vs "qangle" DMX type-name mismatch with KitsuneMDL.
-    hb["orientation"] = datamodel.Vector3((
-        math.degrees(entry.rotation[0]),
-        math.degrees(entry.rotation[1]),
-        math.degrees(entry.rotation[2])))
+    rx, ry, rz = entry.rotation
+    hb["orientation"] = datamodel.Vector3((math.degrees(rx), math.degrees(ry), math.degrees(rz)))
 
 
 def import_hitboxes_from_dmx_root(dm_root, armature: 'object') -> 'tuple[int, int, list]':
@@ -61,7 +59,8 @@ def import_hitboxes_from_dmx_root(dm_root, armature: 'object') -> 'tuple[int, in
     if avs is None:
         return (0, 0, [])
 
-    bone_by_export = {utils.get_bone_exportname(b): b for b in armature.data.bones}
+    export_names = utils.get_bone_exportnames(armature)
+    bone_by_export = {export_names[b.name]: b for b in armature.data.bones}
     bone_by_name = {b.name: b for b in armature.data.bones}
 
     created_count = 0
@@ -102,15 +101,18 @@ def import_hitboxes_from_dmx_root(dm_root, armature: 'object') -> 'tuple[int, in
 def qc_line(entry, bone_export: str, capsule_support: bool) -> str:
     """Return one ``$hbox`` line. Inverse of ``import_hitboxes_from_content``."""
     grp = _group_id(entry.group)
+    mnx, mny, mnz = entry.vec_min
+    mxx, mxy, mxz = entry.vec_max
     base = (
         f'$hbox\t{grp}\t"{bone_export}"\t\t'
-        f'{entry.vec_min[0]:.4f}\t{entry.vec_min[1]:.4f}\t{entry.vec_min[2]:.4f}\t'
-        f'{entry.vec_max[0]:.4f}\t{entry.vec_max[1]:.4f}\t{entry.vec_max[2]:.4f}'
+        f'{mnx:.4f}\t{mny:.4f}\t{mnz:.4f}\t'
+        f'{mxx:.4f}\t{mxy:.4f}\t{mxz:.4f}'
     )
     if capsule_support:
-        rx  = math.degrees(entry.rotation[0])
-        ry  = math.degrees(entry.rotation[1])
-        rz  = math.degrees(entry.rotation[2])
+        rx, ry, rz = entry.rotation
+        rx  = math.degrees(rx)
+        ry  = math.degrees(ry)
+        rz  = math.degrees(rz)
         scl = entry.scale if entry.scale >= 0.0 else -1.0
         return f'{base}\t{rx:.4f}\t{ry:.4f}\t{rz:.4f}\t{scl:.4f}'
     return base
@@ -142,13 +144,16 @@ def import_hitboxes_from_content(content: str, armature: 'object', context, crea
     skipped_count = 0
     skipped_bones = []
 
+    # Name every bone in one pass instead of scanning the bones (each naming call
+    # rebuilding the whole map) per $hbox line. First bone with a given name wins.
+    export_names = utils.get_bone_exportnames(armature)
+    bone_by_export = {}
+    for b in armature.data.bones:
+        bone_by_export.setdefault(export_names[b.name], b)
+
     for hb_data in parsed:
         bone_name = hb_data['bone']
-        bone = None
-        for b in armature.data.bones:
-            if utils.get_bone_exportname(b) == bone_name:
-                bone = b
-                break
+        bone = bone_by_export.get(bone_name)
         if not bone:
             skipped_bones.append(bone_name)
             skipped_count += 1
@@ -181,7 +186,7 @@ def kv3_capsule_kwargs(entry, parent_bone: str) -> dict:
     mn  = Vector(entry.vec_min)
     mx  = Vector(entry.vec_max)
     ctr = (mn + mx) * 0.5
-    rot_mat = Euler((entry.rotation[0], entry.rotation[1], entry.rotation[2]), 'XYZ').to_matrix()
+    rot_mat = Euler(tuple(entry.rotation), 'XYZ').to_matrix()
     p0 = ctr + rot_mat @ (mn - ctr)
     p1 = ctr + rot_mat @ (mx - ctr)
     grp = int(entry.group) if entry.group.lstrip('-').isdigit() else 0
@@ -210,24 +215,7 @@ def import_hitboxes_from_kv3(kv_doc, armature: 'object') -> 'tuple[int, int, lis
     if avs is None:
         return (0, 0, [])
 
-    def find_nodes(node, cls):
-        found = []
-        if isinstance(node, keyvalues3.KVNode):
-            if node.properties.get('_class') == cls:
-                found.append(node)
-            for child in node.children:
-                found.extend(find_nodes(child, cls))
-        elif isinstance(node, dict):
-            for value in node.values():
-                found.extend(find_nodes(value, cls))
-        elif isinstance(node, (list, tuple)):
-            for item in node:
-                found.extend(find_nodes(item, cls))
-        return found
-
-    hitbox_sets = []
-    for root_node in kv_doc.roots.values():
-        hitbox_sets.extend(find_nodes(root_node, 'HitboxSet'))
+    hitbox_sets = kv_doc.nodes_of_class('HitboxSet')
 
     if not hitbox_sets:
         return (0, 0, [])
@@ -235,9 +223,11 @@ def import_hitboxes_from_kv3(kv_doc, armature: 'object') -> 'tuple[int, int, lis
     # Source bone names are case-insensitive; Blender lookups are not. Build both
     # an export-name map and a lowercase fallback so e.g. "leg_upper_l" in a hitbox
     # resolves to a "leg_upper_L" bone.
-    bone_map = {utils.get_bone_exportname(b): b for b in armature.data.bones}
-    bone_map_lower = {utils.get_bone_exportname(b).lower(): b for b in armature.data.bones}
-    for b in armature.data.bones:
+    bones = list(armature.data.bones)
+    export_names = utils.get_bone_exportnames(armature)
+    bone_map = {export_names[b.name]: b for b in bones}
+    bone_map_lower = {export_names[b.name].lower(): b for b in bones}
+    for b in bones:
         bone_map_lower.setdefault(b.name.lower(), b)
 
     created = 0
@@ -15,12 +15,18 @@ because their formats are nested / flag-gated rather than flat.
 """
 
 import math
+import operator
 import re
 
-from .. import utils, keyvalues3
+from .. import utils
 from ..keyvalues3 import KVBool, KVVector3
 
 
+# Writers multiply by this rather than calling math.degrees() per value; the
+# result is bit-identical (math.degrees is x * (180 / pi)).
+_RAD2DEG = 180.0 / math.pi
+
+
 # -----------------------------------------------------------------------------
 # KV3 (Source 2 / ModelDoc) - schema-driven both directions
 # -----------------------------------------------------------------------------
@@ -86,39 +92,70 @@ def _kv3_type(vs):
     return 1 if vs.jiggle_flex_type == 'FLEXIBLE' else 0
 
 
+def _kv3_writer(attr, kind):
+    """Return a ``(vs, s2name, jiggle_length) -> value`` getter for one ``_KV3_FIELDS`` row.
+
+    The kind dispatch happens once here at import time rather than per field per bone.
+    """
+    if kind == 'rootbone':
+        return lambda vs, s2name, jiggle_length: s2name
+    if kind == 'type':
+        return lambda vs, s2name, jiggle_length: _kv3_type(vs)
+    if kind == 'basespringbool':
+        return lambda vs, s2name, jiggle_length: KVBool(vs.jiggle_base_type == 'BASESPRING')
+    if kind == 'length':
+        return lambda vs, s2name, jiggle_length: jiggle_length
+    if kind == 'collbool':
+        return lambda vs, s2name, jiggle_length: KVBool(vs.jiggle_has_collision)
+    if kind == 'collraw0':
+        return lambda vs, s2name, jiggle_length: vs.jiggle_collision_radius0
+    if kind == 'collraw1':
+        return lambda vs, s2name, jiggle_length: vs.jiggle_collision_radius1
+    if kind == 'collvec0':
+        return lambda vs, s2name, jiggle_length: KVVector3(*vs.jiggle_collision_point0)
+    if kind == 'collvec1':
+        return lambda vs, s2name, jiggle_length: KVVector3(*vs.jiggle_collision_point1)
+
+    get = operator.attrgetter(attr)
+    if kind == 'bool':
+        return lambda vs, s2name, jiggle_length: KVBool(get(vs))
+    if kind == 'deg':
+        return lambda vs, s2name, jiggle_length: get(vs) * _RAD2DEG
+    # 'int' / 'raw'
+    return lambda vs, s2name, jiggle_length: get(vs)
+
+
+_KV3_WRITERS = [(key, _kv3_writer(attr, kind)) for key, attr, kind in _KV3_FIELDS]
+
+
 def kv3_kwargs(vs, s2name, jiggle_length) -> dict:
     """Build the ``JiggleBone`` KVNode property kwargs (excluding _class/name).
 
     ``s2name`` is the prefab-stripped bone name and ``jiggle_length`` the resolved
     length, both computed by the exporter (they need the bone, not just bone.vs).
     """
-    kw = {}
-    for key, attr, kind in _KV3_FIELDS:
-        if kind == 'rootbone':
-            kw[key] = s2name
-        elif kind == 'type':
-            kw[key] = _kv3_type(vs)
-        elif kind == 'basespringbool':
-            kw[key] = KVBool(vs.jiggle_base_type == 'BASESPRING')
-        elif kind == 'length':
-            kw[key] = jiggle_length
-        elif kind == 'bool':
-            kw[key] = KVBool(getattr(vs, attr))
-        elif kind == 'deg':
-            kw[key] = math.degrees(getattr(vs, attr))
-        elif kind == 'collbool':
-            kw[key] = KVBool(vs.jiggle_has_collision)
-        elif kind == 'collraw0':
-            kw[key] = vs.jiggle_collision_radius0
-        elif kind == 'collraw1':
-            kw[key] = vs.jiggle_collision_radius1
-        elif kind == 'collvec0':
-            kw[key] = KVVector3(*vs.jiggle_collision_point0)
-        elif kind == 'collvec1':
-            kw[key] = KVVector3(*vs.jiggle_collision_point1)
-        else:  # 'int' / 'raw'
-            kw[key] = getattr(vs, attr)
-    return kw
+    return {key: write(vs, s2name, jiggle_length) for key, write in _KV3_WRITERS}
+
+
+def _kv3_reader(kind):
+    """Return a ``(value) -> vs value`` converter for one readable ``_KV3_FIELDS`` row."""
+    if kind == 'bool':
+        return bool
+    if kind == 'deg':
+        return lambda v: math.radians(float(v))
+    if kind == 'int':
+        return lambda v: int(float(v))
+    # 'raw'
+    return float
+
+
+# Readable rows only: (kv3_key, vs_attr, converter, default). Rows with no vs_attr
+# (rootbone / type / basespring / length / collision) are handled in _read_kv3_props
+# or are write-only.
+_KV3_READERS = [
+    (key, attr, _kv3_reader(kind), False if kind == 'bool' else 0.0)
+    for key, attr, kind in _KV3_FIELDS if attr is not None
+]
 
 
 def _read_kv3_props(vs, props) -> None:
@@ -129,54 +166,34 @@ def _read_kv3_props(vs, props) -> None:
     vs.jiggle_has_base_spring = has_bs
     vs.jiggle_base_type = 'BASESPRING' if has_bs else 'NONE'
 
-    vs.jiggle_length = float(props.get('length', 0.0))
-    vs.use_bone_length_for_jigglebone_length = vs.jiggle_length == 0.0
+    length = float(props.get('length', 0.0))
+    vs.jiggle_length = length
+    vs.use_bone_length_for_jigglebone_length = length == 0.0
 
-    for key, attr, kind in _KV3_FIELDS:
-        if attr is None:
-            continue  # rootbone / type / basespring / length / collision handled above or write-only
-        if kind == 'bool':
-            setattr(vs, attr, props.get(key, False))
-        elif kind == 'deg':
-            setattr(vs, attr, math.radians(float(props.get(key, 0.0))))
-        elif kind == 'int':
-            setattr(vs, attr, int(float(props.get(key, 0))))
-        else:  # 'raw'
-            setattr(vs, attr, float(props.get(key, 0.0)))
+    get = props.get
+    for key, attr, conv, default in _KV3_READERS:
+        setattr(vs, attr, conv(get(key, default)))
 
 
 def import_jigglebones_from_kv3(kv_doc, armature: 'object') -> 'tuple[int, list]':
     imported_count = 0
     missing_bones = []
 
-    # Source bone names are case-insensitive; keep a lowercase fallback map.
-    bone_map = {utils.get_bone_exportname(b): b for b in armature.data.bones}
-    bone_map_lower = {utils.get_bone_exportname(b).lower(): b for b in armature.data.bones}
-    for b in armature.data.bones:
-        bone_map_lower.setdefault(b.name.lower(), b)
-
-    def find_jigglebone_nodes(node):
-        found = []
-        if isinstance(node, keyvalues3.KVNode):
-            if node.properties.get('_class') == "JiggleBone":
-                found.append(node)
-            for child in node.children:
-                found.extend(find_jigglebone_nodes(child))
-        elif isinstance(node, dict):
-            for value in node.values():
-                found.extend(find_jigglebone_nodes(value))
-        elif isinstance(node, (list, tuple)):
-            for item in node:
-                found.extend(find_jigglebone_nodes(item))
-        return found
-
-    jigglebone_nodes = []
-    for root_node in kv_doc.roots.values():
-        jigglebone_nodes.extend(find_jigglebone_nodes(root_node))
+    jigglebone_nodes = kv_doc.nodes_of_class("JiggleBone")
 
     if not jigglebone_nodes:
         return 0, []
 
+    # Only name the bones once there is something to match. get_bone_exportname rebuilds
+    # the armature's whole name map per call, so resolve every export name in one pass.
+    # Source bone names are case-insensitive; keep a lowercase fallback map.
+    bones = list(armature.data.bones)
+    export_names = utils.get_bone_exportnames(armature)
+    bone_map = {export_names[b.name]: b for b in bones}
+    bone_map_lower = {export_names[b.name].lower(): b for b in bones}
+    for b in bones:
+        bone_map_lower.setdefault(b.name.lower(), b)
+
     for jb_node in jigglebone_nodes:
         props = jb_node.properties
 
@@ -231,14 +248,14 @@ def write_dme_attrs(elem, bone) -> None:
 
         elem["yawConstrained"] = bool(bvs.jiggle_has_yaw_constraint)
         if bvs.jiggle_has_yaw_constraint:
-            elem["yawMin"]      = -abs(math.degrees(bvs.jiggle_yaw_constraint_min))
-            elem["yawMax"]      =  abs(math.degrees(bvs.jiggle_yaw_constraint_max))
+            elem["yawMin"]      = -abs(bvs.jiggle_yaw_constraint_min * _RAD2DEG)
+            elem["yawMax"]      =  abs(bvs.jiggle_yaw_constraint_max * _RAD2DEG)
             elem["yawFriction"] = float(bvs.jiggle_yaw_friction)
 
         elem["pitchConstrained"] = bool(bvs.jiggle_has_pitch_constraint)
         if bvs.jiggle_has_pitch_constraint:
-            elem["pitchMin"]      = -abs(math.degrees(bvs.jiggle_pitch_constraint_min))
-            elem["pitchMax"]      =  abs(math.degrees(bvs.jiggle_pitch_constraint_max))
+            elem["pitchMin"]      = -abs(bvs.jiggle_pitch_constraint_min * _RAD2DEG)
+            elem["pitchMax"]      =  abs(bvs.jiggle_pitch_constraint_max * _RAD2DEG)
             elem["pitchFriction"] = float(bvs.jiggle_pitch_friction)
 
         # Flexible jigglebones constrain length by DEFAULT; "allow length flex" RELEASES it.
@@ -251,7 +268,7 @@ def write_dme_attrs(elem, bone) -> None:
 
         elem["angleConstrained"] = bool(bvs.jiggle_has_angle_constraint)
         if bvs.jiggle_has_angle_constraint:
-            elem["angleLimit"] = math.degrees(bvs.jiggle_angle_constraint)
+            elem["angleLimit"] = bvs.jiggle_angle_constraint * _RAD2DEG
 
     if bvs.jiggle_base_type == 'BASESPRING':
         elem["baseSpring"]    = True
@@ -273,7 +290,7 @@ def write_dme_attrs(elem, bone) -> None:
     elif bvs.jiggle_base_type == 'BOING':
         elem["boing"]            = True
         elem["boingImpactSpeed"] = float(bvs.jiggle_impact_speed)
-        elem["boingImpactAngle"] = math.degrees(bvs.jiggle_impact_angle)
+        elem["boingImpactAngle"] = bvs.jiggle_impact_angle * _RAD2DEG
         elem["boingDampingRate"] = float(bvs.jiggle_damping_rate)
         elem["boingFrequency"]   = float(bvs.jiggle_frequency)
         elem["boingAmplitude"]   = float(bvs.jiggle_amplitude)
@@ -284,7 +301,8 @@ def import_jigglebones_from_dmx_elements(elements, armature: 'object') -> 'tuple
     missing_bones: list = []
 
     # Match by exported name first, then by raw bone name (case-insensitive fallback).
-    bone_by_export = {utils.get_bone_exportname(b): b for b in armature.data.bones}
+    export_names = utils.get_bone_exportnames(armature)
+    bone_by_export = {export_names[b.name]: b for b in armature.data.bones}
     bone_by_name = {b.name: b for b in armature.data.bones}
     bone_by_name_lower = {b.name.lower(): b for b in armature.data.bones}
 
@@ -388,71 +406,149 @@ def import_jigglebones_from_dmx_elements(elements, armature: 'object') -> 'tuple
 # QC text ($jigglebone) - structured codec, writer + reader adjacent
 # -----------------------------------------------------------------------------
 
-def qc_block_lines(bone) -> list:
+def qc_block_lines(bone, export_name=None) -> list:
     """Return the QC text lines for one ``$jigglebone`` block.
 
+    ``export_name`` may be passed by callers that already resolved the bone's
+    export name; otherwise it is looked up here.
+
     The inverse reader is ``import_jigglebones_from_content`` directly below.
     NOTE: QC intentionally omits ``along_damping`` (DME/KV3 write it); preserved
     here to keep .qci output byte-identical.
     """
+    bvs = bone.vs
     d = []
-    d.append(f'$jigglebone "{utils.get_bone_exportname(bone)}"')
+    if export_name is None:
+        export_name = utils.get_bone_exportname(bone)
+    d.append(f'$jigglebone "{export_name}"')
     d.append('{')
-    jiggle_length = bone.length if bone.vs.use_bone_length_for_jigglebone_length else bone.vs.jiggle_length
+    jiggle_length = bone.length if bvs.use_bone_length_for_jigglebone_length else bvs.jiggle_length
+    flex_type = bvs.jiggle_flex_type
+    base_type = bvs.jiggle_base_type
 
-    if bone.vs.jiggle_flex_type in ['FLEXIBLE', 'RIGID']:
-        d.append('\tis_flexible' if bone.vs.jiggle_flex_type == 'FLEXIBLE' else '\tis_rigid')
+    if flex_type in ('FLEXIBLE', 'RIGID'):
+        d.append('\tis_flexible' if flex_type == 'FLEXIBLE' else '\tis_rigid')
         d.append('\t{')
         d.append(f'\t\tlength {jiggle_length:.4f}')
-        d.append(f'\t\ttip_mass {bone.vs.jiggle_tip_mass:.2f}')
-        if bone.vs.jiggle_flex_type == 'FLEXIBLE':
-            d.append(f'\t\tyaw_stiffness {bone.vs.jiggle_yaw_stiffness:.4f}')
-            d.append(f'\t\tyaw_damping {bone.vs.jiggle_yaw_damping:.4f}')
-            if bone.vs.jiggle_has_yaw_constraint:
-                d.append(f'\t\tyaw_constraint {-abs(math.degrees(bone.vs.jiggle_yaw_constraint_min)):.4f} {abs(math.degrees(bone.vs.jiggle_yaw_constraint_max)):.4f}')
-                d.append(f'\t\tyaw_friction {bone.vs.jiggle_yaw_friction:.3f}')
-            d.append(f'\t\tpitch_stiffness {bone.vs.jiggle_pitch_stiffness:.4f}')
-            d.append(f'\t\tpitch_damping {bone.vs.jiggle_pitch_damping:.4f}')
-            if bone.vs.jiggle_has_pitch_constraint:
-                d.append(f'\t\tpitch_constraint {-abs(math.degrees(bone.vs.jiggle_pitch_constraint_min)):.4f} {abs(math.degrees(bone.vs.jiggle_pitch_constraint_max)):.4f}')
-                d.append(f'\t\tpitch_friction {bone.vs.jiggle_pitch_friction:.3f}')
-            if bone.vs.jiggle_allow_length_flex:
+        d.append(f'\t\ttip_mass {bvs.jiggle_tip_mass:.2f}')
+        if flex_type == 'FLEXIBLE':
+            d.append(f'\t\tyaw_stiffness {bvs.jiggle_yaw_stiffness:.4f}')
+            d.append(f'\t\tyaw_damping {bvs.jiggle_yaw_damping:.4f}')
+            if bvs.jiggle_has_yaw_constraint:
+                d.append(f'\t\tyaw_constraint {-abs(bvs.jiggle_yaw_constraint_min * _RAD2DEG):.4f} {abs(bvs.jiggle_yaw_constraint_max * _RAD2DEG):.4f}')
+                d.append(f'\t\tyaw_friction {bvs.jiggle_yaw_friction:.3f}')
+            d.append(f'\t\tpitch_stiffness {bvs.jiggle_pitch_stiffness:.4f}')
+            d.append(f'\t\tpitch_damping {bvs.jiggle_pitch_damping:.4f}')
+            if bvs.jiggle_has_pitch_constraint:
+                d.append(f'\t\tpitch_constraint {-abs(bvs.jiggle_pitch_constraint_min * _RAD2DEG):.4f} {abs(bvs.jiggle_pitch_constraint_max * _RAD2DEG):.4f}')
+                d.append(f'\t\tpitch_friction {bvs.jiggle_pitch_friction:.3f}')
+            if bvs.jiggle_allow_length_flex:
                 d.append('\t\tallow_length_flex')
-                d.append(f'\t\talong_stiffness {bone.vs.jiggle_along_stiffness:.4f}')
-            if bone.vs.jiggle_has_angle_constraint:
-                d.append(f'\t\tangle_constraint {math.degrees(bone.vs.jiggle_angle_constraint):.4f}')
+                d.append(f'\t\talong_stiffness {bvs.jiggle_along_stiffness:.4f}')
+            if bvs.jiggle_has_angle_constraint:
+                d.append(f'\t\tangle_constraint {bvs.jiggle_angle_constraint * _RAD2DEG:.4f}')
         d.append('\t}')
 
-    if bone.vs.jiggle_base_type == 'BASESPRING':
+    if base_type == 'BASESPRING':
         d.append('\thas_base_spring')
         d.append('\t{')
-        d.append(f'\t\tstiffness {bone.vs.jiggle_base_stiffness:.4f}')
-        d.append(f'\t\tdamping {bone.vs.jiggle_base_damping:.4f}')
-        d.append(f'\t\tbase_mass {bone.vs.jiggle_base_mass}')
-        if bone.vs.jiggle_has_left_constraint:
-            d.append(f'\t\tleft_constraint {-abs(bone.vs.jiggle_left_constraint_min):.2f} {abs(bone.vs.jiggle_left_constraint_max):.2f}')
-            d.append(f'\t\tleft_friction {bone.vs.jiggle_left_friction:.3f}')
-        if bone.vs.jiggle_has_up_constraint:
-            d.append(f'\t\tup_constraint {-abs(bone.vs.jiggle_up_constraint_min):.2f} {abs(bone.vs.jiggle_up_constraint_max):.2f}')
-            d.append(f'\t\tup_friction {bone.vs.jiggle_up_friction:.3f}')
-        if bone.vs.jiggle_has_forward_constraint:
-            d.append(f'\t\tforward_constraint {-abs(bone.vs.jiggle_forward_constraint_min):.2f} {abs(bone.vs.jiggle_forward_constraint_max):.2f}')
-            d.append(f'\t\tforward_friction {bone.vs.jiggle_forward_friction:.3f}')
+        d.append(f'\t\tstiffness {bvs.jiggle_base_stiffness:.4f}')
+        d.append(f'\t\tdamping {bvs.jiggle_base_damping:.4f}')
+        d.append(f'\t\tbase_mass {bvs.jiggle_base_mass}')
+        if bvs.jiggle_has_left_constraint:
+            d.append(f'\t\tleft_constraint {-abs(bvs.jiggle_left_constraint_min):.2f} {abs(bvs.jiggle_left_constraint_max):.2f}')
+            d.append(f'\t\tleft_friction {bvs.jiggle_left_friction:.3f}')
+        if bvs.jiggle_has_up_constraint:
+            d.append(f'\t\tup_constraint {-abs(bvs.jiggle_up_constraint_min):.2f} {abs(bvs.jiggle_up_constraint_max):.2f}')
+            d.append(f'\t\tup_friction {bvs.jiggle_up_friction:.3f}')
+        if bvs.jiggle_has_forward_constraint:
+            d.append(f'\t\tforward_constraint {-abs(bvs.jiggle_forward_constraint_min):.2f} {abs(bvs.jiggle_forward_constraint_max):.2f}')
+            d.append(f'\t\tforward_friction {bvs.jiggle_forward_friction:.3f}')
         d.append('\t}')
-    elif bone.vs.jiggle_base_type == 'BOING':
+    elif base_type == 'BOING':
         d.append('\tis_boing')
         d.append('\t{')
-        d.append(f'\t\timpact_speed {bone.vs.jiggle_impact_speed}')
-        d.append(f'\t\timpact_angle {math.degrees(bone.vs.jiggle_impact_angle):.4f}')
-        d.append(f'\t\tdamping_rate {bone.vs.jiggle_damping_rate:.3f}')
-        d.append(f'\t\tfrequency {bone.vs.jiggle_frequency:.3f}')
-        d.append(f'\t\tamplitude {bone.vs.jiggle_amplitude:.3f}')
+        d.append(f'\t\timpact_speed {bvs.jiggle_impact_speed}')
+        d.append(f'\t\timpact_angle {bvs.jiggle_impact_angle * _RAD2DEG:.4f}')
+        d.append(f'\t\tdamping_rate {bvs.jiggle_damping_rate:.3f}')
+        d.append(f'\t\tfrequency {bvs.jiggle_frequency:.3f}')
+        d.append(f'\t\tamplitude {bvs.jiggle_amplitude:.3f}')
         d.append('\t}')
     d.append('}')
     d.append('\n')
     return d
 
 
+def _qc_int(v):
+    return int(float(v))
+
+
+def _qc_radians(v):
+    return math.radians(float(v))
+
+
+def _qc_abs_radians(v):
+    return abs(math.radians(v))
+
+
+# Plain fields of each $jigglebone sub-block: (qc key, vs attr, converter). A key the
+# block leaves out still resets its property, so every row is read with a 0 default.
+_QC_FLEX_FIELDS = (
+    ('length',          'jiggle_length',          float),
+    ('tip_mass',        'jiggle_tip_mass',        float),
+    ('yaw_stiffness',   'jiggle_yaw_stiffness',   float),
+    ('yaw_damping',     'jiggle_yaw_damping',     float),
+    ('pitch_stiffness', 'jiggle_pitch_stiffness', float),
+    ('pitch_damping',   'jiggle_pitch_damping',   float),
+)
+_QC_RIGID_FIELDS = _QC_FLEX_FIELDS[:2]
+_QC_BASESPRING_FIELDS = (
+    ('stiffness', 'jiggle_base_stiffness', float),
+    ('damping',   'jiggle_base_damping',   float),
+    ('base_mass', 'jiggle_base_mass',      _qc_int),
+)
+_QC_BOING_FIELDS = (
+    ('impact_speed', 'jiggle_impact_speed', _qc_int),
+    ('impact_angle', 'jiggle_impact_angle', _qc_radians),
+    ('damping_rate', 'jiggle_damping_rate', float),
+    ('frequency',    'jiggle_frequency',    float),
+    ('amplitude',    'jiggle_amplitude',    float),
+)
+
+def _qc_constraint_rows(directions, conv):
+    """Rows for the ``<dir>_constraint min max`` / ``<dir>_friction`` keys, which are only
+    applied when present: (constraint key, friction key, has attr, min attr, max attr,
+    friction attr, limit converter).
+    """
+    return tuple(
+        (f'{d}_constraint', f'{d}_friction', f'jiggle_has_{d}_constraint',
+         f'jiggle_{d}_constraint_min', f'jiggle_{d}_constraint_max', f'jiggle_{d}_friction', conv)
+        for d in directions
+    )
+
+
+# Flexible yaw/pitch limits are degrees; base spring limits are written raw.
+_QC_FLEX_CONSTRAINTS = _qc_constraint_rows(('yaw', 'pitch'), _qc_abs_radians)
+_QC_BASESPRING_CONSTRAINTS = _qc_constraint_rows(('left', 'up', 'forward'), abs)
+
+
+def _read_qc_fields(vs, data, fields) -> None:
+    get = data.get
+    for key, attr, conv in fields:
+        setattr(vs, attr, conv(get(key, 0)))
+
+
+def _read_qc_constraints(vs, data, rows) -> None:
+    for key, fric_key, has_attr, min_attr, max_attr, fric_attr, conv in rows:
+        if key in data:
+            setattr(vs, has_attr, True)
+            vals = [float(x) for x in data[key].split()]
+            setattr(vs, min_attr, conv(vals[0]))
+            setattr(vs, max_attr, conv(vals[1]))
+        if fric_key in data:
+            setattr(vs, fric_attr, float(data[fric_key]))
+
+
 def import_jigglebones_from_content(content: str, armature: 'object') -> 'tuple[int, list]':
     """
     Import jigglebones from text content containing $jigglebone definitions.
@@ -464,7 +560,8 @@ def import_jigglebones_from_content(content: str, armature: 'object') -> 'tuple[
     # Remove comments to simplify parsing
     content = re.sub(r"//.*", "", content)
 
-    bone_map = {utils.get_bone_exportname(b): b for b in armature.data.bones}
+    export_names = utils.get_bone_exportnames(armature)
+    bone_map = {export_names[b.name]: b for b in armature.data.bones}
 
     # A simple recursive descent parser for the QC-like key-value format.
     # It handles nested blocks and values.
@@ -574,29 +671,8 @@ def import_jigglebones_from_content(content: str, armature: 'object') -> 'tuple[
             vs_bone.jiggle_flex_type = 'FLEXIBLE'
             flex_data = current_jigglebone_data['is_flexible']
             if isinstance(flex_data, dict):
-                vs_bone.jiggle_length = float(flex_data.get('length', 0.0))
-                vs_bone.jiggle_tip_mass = float(flex_data.get('tip_mass', 0.0))
-                vs_bone.jiggle_yaw_stiffness = float(flex_data.get('yaw_stiffness', 0.0))
-                vs_bone.jiggle_yaw_damping = float(flex_data.get('yaw_damping', 0.0))
-
-                if 'yaw_constraint' in flex_data:
-                    vs_bone.jiggle_has_yaw_constraint = True
-                    yc_vals = [float(x) for x in flex_data['yaw_constraint'].split()]
-                    vs_bone.jiggle_yaw_constraint_min = abs(math.radians(yc_vals[0]))
-                    vs_bone.jiggle_yaw_constraint_max = abs(math.radians(yc_vals[1]))
-                if 'yaw_friction' in flex_data:
-                    vs_bone.jiggle_yaw_friction = float(flex_data['yaw_friction'])
-
-                vs_bone.jiggle_pitch_stiffness = float(flex_data.get('pitch_stiffness', 0.0))
-                vs_bone.jiggle_pitch_damping = float(flex_data.get('pitch_damping', 0.0))
-
-                if 'pitch_constraint' in flex_data:
-                    vs_bone.jiggle_has_pitch_constraint = True
-                    pc_vals = [float(x) for x in flex_data['pitch_constraint'].split()]
-                    vs_bone.jiggle_pitch_constraint_min = abs(math.radians(pc_vals[0]))
-                    vs_bone.jiggle_pitch_constraint_max = abs(math.radians(pc_vals[1]))
-                if 'pitch_friction' in flex_data:
-                    vs_bone.jiggle_pitch_friction = float(flex_data['pitch_friction'])
+                _read_qc_fields(vs_bone, flex_data, _QC_FLEX_FIELDS)
+                _read_qc_constraints(vs_bone, flex_data, _QC_FLEX_CONSTRAINTS)
 
                 vs_bone.jiggle_allow_length_flex = 'allow_length_flex' in flex_data
                 if vs_bone.jiggle_allow_length_flex and isinstance(flex_data['allow_length_flex'], dict):
@@ -612,8 +688,7 @@ def import_jigglebones_from_content(content: str, armature: 'object') -> 'tuple[
             vs_bone.jiggle_flex_type = 'RIGID'
             rigid_data = current_jigglebone_data['is_rigid']
             if isinstance(rigid_data, dict):
-                vs_bone.jiggle_length = float(rigid_data.get('length', 0.0))
-                vs_bone.jiggle_tip_mass = float(rigid_data.get('tip_mass', 0.0))
+                _read_qc_fields(vs_bone, rigid_data, _QC_RIGID_FIELDS)
         else:
             vs_bone.jiggle_flex_type = 'NONE'
 
@@ -621,43 +696,14 @@ def import_jigglebones_from_content(content: str, armature: 'object') -> 'tuple[
             vs_bone.jiggle_base_type = 'BASESPRING'
             base_data = current_jigglebone_data['has_base_spring']
             if isinstance(base_data, dict):
-                vs_bone.jiggle_base_stiffness = float(base_data.get('stiffness', 0.0))
-                vs_bone.jiggle_base_damping = float(base_data.get('damping', 0.0))
-                vs_bone.jiggle_base_mass = int(float(base_data.get('base_mass', 0)))
-
-                if 'left_constraint' in base_data:
-                    vs_bone.jiggle_has_left_constraint = True
-                    lc_vals = [float(x) for x in base_data['left_constraint'].split()]
-                    vs_bone.jiggle_left_constraint_min = abs(lc_vals[0])
-                    vs_bone.jiggle_left_constraint_max = abs(lc_vals[1])
-                if 'left_friction' in base_data:
-                    vs_bone.jiggle_left_friction = float(base_data['left_friction'])
-
-                if 'up_constraint' in base_data:
-                    vs_bone.jiggle_has_up_constraint = True
-                    uc_vals = [float(x) for x in base_data['up_constraint'].split()]
-                    vs_bone.jiggle_up_constraint_min = abs(uc_vals[0])
-                    vs_bone.jiggle_up_constraint_max = abs(uc_vals[1])
-                if 'up_friction' in base_data:
-                    vs_bone.jiggle_up_friction = float(base_data['up_friction'])
-
-                if 'forward_constraint' in base_data:
-                    vs_bone.jiggle_has_forward_constraint = True
-                    fc_vals = [float(x) for x in base_data['forward_constraint'].split()]
-                    vs_bone.jiggle_forward_constraint_min = abs(fc_vals[0])
-                    vs_bone.jiggle_forward_constraint_max = abs(fc_vals[1])
-                if 'forward_friction' in base_data:
-                    vs_bone.jiggle_forward_friction = float(base_data['forward_friction'])
+                _read_qc_fields(vs_bone, base_data, _QC_BASESPRING_FIELDS)
+                _read_qc_constraints(vs_bone, base_data, _QC_BASESPRING_CONSTRAINTS)
 
         elif 'is_boing' in current_jigglebone_data:
             vs_bone.jiggle_base_type = 'BOING'
             boing_data = current_jigglebone_data['is_boing']
             if isinstance(boing_data, dict):
-                vs_bone.jiggle_impact_speed = int(float(boing_data.get('impact_speed', 0)))
-                vs_bone.jiggle_impact_angle = math.radians(float(boing_data.get('impact_angle', 0.0)))
-                vs_bone.jiggle_damping_rate = float(boing_data.get('damping_rate', 0.0))
-                vs_bone.jiggle_frequency = float(boing_data.get('frequency', 0.0))
-                vs_bone.jiggle_amplitude = float(boing_data.get('amplitude', 0.0))
+                _read_qc_fields(vs_bone, boing_data, _QC_BOING_FIELDS)
         else:
             vs_bone.jiggle_base_type = 'NONE'
 
@@ -482,7 +482,11 @@ def _find_action_slot(action, slot_name: str):
 def _get_action_fcurves(action, slot_name: str) -> list:
     if getattr(action, 'is_action_legacy', True):
         return list(action.fcurves)
-    target_slot = _find_action_slot(action, slot_name)
+    return _get_slot_fcurves(action, _find_action_slot(action, slot_name))
+
+
+def _get_slot_fcurves(action, target_slot) -> list:
+    """Return the fcurves of an already resolved slot of a layered action."""
     if target_slot is None:
         return []
     for layer in action.layers:
@@ -516,12 +520,13 @@ def _bone_keyframes(fcurves, bone_name: str) -> list[float]:
 
 _BONE_XFORM_RE = _re.compile(r'^pose\.bones\["([^"]+)"\]\.(?:rotation|location|scale)')
 
-def _get_proc_trigger_frame_range(entry, arm_ob) -> tuple[int, int, bool]:
+def _get_proc_trigger_frame_range(entry, arm_ob, fcurves=None) -> tuple[int, int, bool]:
     """Return (frame_start, frame_end, is_valid) for a TRIGGER proc bone entry.
 
     Manual mode uses the stored frame range props.  Auto mode scans the action
     for the first/last keyframe of any transform channel on a bone that still
-    exists in the armature (excluding property paths like vs.proc_tolerance)."""
+    exists in the armature (excluding property paths like vs.proc_tolerance).
+    Pass fcurves when the caller has already resolved them for entry.action."""
     if getattr(entry, 'use_manual_frame_range', False):
         fs = entry.trigger_frame_start
         fe = entry.trigger_frame_end
@@ -530,7 +535,8 @@ def _get_proc_trigger_frame_range(entry, arm_ob) -> tuple[int, int, bool]:
     action = entry.action
     if not action:
         return 0, 0, False
-    fcurves  = _get_action_fcurves(action, entry.action_slot_name)
+    if fcurves is None:
+        fcurves = _get_action_fcurves(action, entry.action_slot_name)
     existing = {b.name for b in arm_ob.data.bones} if arm_ob else set()
     frames: list[float] = []
     for fc in fcurves:
@@ -613,38 +619,94 @@ def _temp_unmute_helper(arm_ob, bone_name: str) -> None:
                 fc.mute = False
 
 
+def _helper_is_unmuted(arm_ob, bone_name: str) -> bool:
+    """True when no constraint or driver on the helper bone is muted, i.e. when
+    _temp_unmute_helper would leave the bone exactly as it is."""
+    pb = arm_ob.pose.bones.get(bone_name)
+    if pb and any(c.mute for c in pb.constraints):
+        return False
+    anim = arm_ob.animation_data
+    if anim:
+        prefix = f'pose.bones["{bone_name}"].'
+        for fc in anim.drivers:
+            if fc.mute and fc.data_path.startswith(prefix):
+                return False
+    return True
+
+
 def _build_proc_triggers(arm_ob, entry, entry_idx: int, scene, export_print = False) -> list:
     """Sample trigger-target pairs from the action by evaluating the scene at each
     driver bone keyframe frame. Returns list of (driver_quat, helper_quat)."""
+    triggers, message = _build_proc_triggers_batch(arm_ob, [entry], scene, export_print)[0]
+    if message:
+        print(message)
+    return triggers
+
+
+def _build_proc_triggers_batch(arm_ob, entries, scene, export_print = False) -> list[tuple]:
+    """Sample the triggers of several entries that share one action and slot.
+
+    Returns one ``(triggers, message)`` pair per entry, in order. ``message`` is the
+    progress or warning line for that entry (or None); it is returned rather than
+    printed so callers can report it next to the entry it describes.
+
+    The group is stepped through the union of the entries' frames once, and every
+    entry reads its driver/helper pair only on its own frames, in ascending order,
+    exactly as its own pass would. This gives the same triggers as sampling each
+    entry alone because:
+
+    - frame_set with this action and slot fully determines the pose at a frame:
+      keyed channels come from the action, non-keyed ones keep the snapshot pose
+      (neither pass writes them), and the simulation is skipped while
+      _building_proc_cache is set, so visiting extra frames changes nothing;
+    - a single pass unmutes only its own helper, so the others are evaluated in
+      their current mute state. Sampling the group together is therefore only done
+      when no helper has a muted constraint or driver (which includes every helper
+      the running simulation overrides); otherwise each entry gets its own pass.
+    """
+    if len(entries) > 1 and not all(_helper_is_unmuted(arm_ob, e.helper_bone) for e in entries):
+        return [_build_proc_triggers_batch(arm_ob, [e], scene, export_print)[0] for e in entries]
+
     global _building_proc_cache
-    if _building_proc_cache:
-        return []
+    results: list[list] = [[] for _ in entries]
+    messages: list = [None] * len(entries)
+    if _building_proc_cache or not entries:
+        return list(zip(results, messages))
 
-    action = entry.action
+    action = entries[0].action
     if not action:
-        return []
+        return list(zip(results, messages))
 
     anim = arm_ob.animation_data
     if anim is None:
-        return []
+        return list(zip(results, messages))
 
-    # Determine frame range via shared helper (respects manual vs auto mode).
-    fs, fe, valid = _get_proc_trigger_frame_range(entry, arm_ob)
-    if not valid:
-        print(f"[ProcBones] No valid frame range for '{entry.helper_bone}' "
-              f"in action '{action.name}' : check action has bone keyframes")
-        return []
-    frames = list(range(fs, fe + 1))
-
-    # Find per-trigger tolerance fcurve once (keyed on driver bone).
-    fcurves = _get_action_fcurves(action, entry.action_slot_name)
-    _tol_dp = f'bones["{entry.driver_bone}"].vs.proc_tolerance'
-    _tol_fc = next((fc for fc in fcurves
-                    if fc.data_path == _tol_dp and fc.array_index == 0), None)
+    # Resolve the slot and its fcurves once; the frame ranges, tolerance curves and
+    # slot assignment below all work from the same lookup.
+    is_legacy   = getattr(action, 'is_action_legacy', True)
+    target_slot = None if is_legacy else _find_action_slot(action, entries[0].action_slot_name)
+    fcurves     = list(action.fcurves) if is_legacy else _get_slot_fcurves(action, target_slot)
 
-    # Resolve target slot for assignment
-    is_legacy     = getattr(action, 'is_action_legacy', True)
-    target_slot   = None if is_legacy else _find_action_slot(action, entry.action_slot_name)
+    # Per-trigger tolerance fcurves are keyed on the driver bone; first match wins.
+    tol_fcurves = {}
+    for fc in fcurves:
+        if fc.array_index == 0:
+            tol_fcurves.setdefault(fc.data_path, fc)
+
+    jobs = []
+    frames: set[int] = set()
+    for i, entry in enumerate(entries):
+        # Determine frame range via shared helper (respects manual vs auto mode).
+        fs, fe, valid = _get_proc_trigger_frame_range(entry, arm_ob, fcurves)
+        if not valid:
+            messages[i] = (f"[ProcBones] No valid frame range for '{entry.helper_bone}' "
+                           f"in action '{action.name}' : check action has bone keyframes")
+            continue
+        frames.update(range(fs, fe + 1))
+        tol_fc = tol_fcurves.get(f'bones["{entry.driver_bone}"].vs.proc_tolerance')
+        jobs.append((i, entry, results[i], fs, fe, tol_fc))
+    if not jobs:
+        return list(zip(results, messages))
 
     # Save state
     orig_frame   = scene.frame_current
@@ -652,7 +714,8 @@ def _build_proc_triggers(arm_ob, entry, entry_idx: int, scene, export_print = Fa
     orig_use_nla = anim.use_nla
     orig_slot_handle = getattr(anim, 'action_slot_handle', None)
 
-    was_overridden = (arm_ob.name, entry.helper_bone) in _overridden_helpers
+    helpers = {entry.helper_bone for _, entry, *_ in jobs}
+    was_overridden = {h for h in helpers if (arm_ob.name, h) in _overridden_helpers}
     # Snapshot the current pose so it can be restored exactly after cache build.
     # The identity-then-frame_set approach in the finally block only restores
     # keyframed bones; this snapshot preserves manually posed (non-keyframed) bones.
@@ -660,10 +723,11 @@ def _build_proc_triggers(arm_ob, entry, entry_idx: int, scene, export_print = Fa
 
     _building_proc_cache = True
     try:
-        # Unmute constraints/drivers on the helper so frame_set captures their
+        # Unmute constraints/drivers on the helpers so frame_set captures their
         # effect. If sim was already running (was_overridden), saved states are
         # preserved in _helper_saved_mutes - _temp_unmute_helper doesn't touch them.
-        _temp_unmute_helper(arm_ob, entry.helper_bone)
+        for helper in helpers:
+            _temp_unmute_helper(arm_ob, helper)
 
         anim.use_nla = False
         anim.action  = action
@@ -676,26 +740,29 @@ def _build_proc_triggers(arm_ob, entry, entry_idx: int, scene, export_print = Fa
                 except Exception:
                     pass
 
-        triggers = []
-        for frame in frames:
+        pose_bones = arm_ob.pose.bones
+        for frame in sorted(frames):
             scene.frame_set(int(frame), subframe=frame - int(frame))
-            d_pb = arm_ob.pose.bones.get(entry.driver_bone)
-            h_pb = arm_ob.pose.bones.get(entry.helper_bone)
-            if d_pb and h_pb:
-                d_local = arm_ob.convert_space(
-                    pose_bone=d_pb, matrix=d_pb.matrix,
-                    from_space='POSE', to_space='LOCAL')
-                dq   = d_local.to_quaternion().normalized()
-                dloc = d_local.to_translation()
-                # Read the full constraint/driver-evaluated pose in local space.
-                h_local = arm_ob.convert_space(
-                    pose_bone=h_pb, matrix=h_pb.matrix,
-                    from_space='POSE', to_space='LOCAL')
-                hloc = h_local.to_translation()
-                hq   = h_local.to_quaternion().normalized()
-                tol = (_tol_fc.evaluate(frame) if _tol_fc is not None
-                       else d_pb.bone.vs.proc_tolerance)
-                triggers.append((dq, dloc, hloc, hq, tol))
+            for _, entry, triggers, fs, fe, tol_fc in jobs:
+                if not fs <= frame <= fe:
+                    continue
+                d_pb = pose_bones.get(entry.driver_bone)
+                h_pb = pose_bones.get(entry.helper_bone)
+                if d_pb and h_pb:
+                    d_local = arm_ob.convert_space(
+                        pose_bone=d_pb, matrix=d_pb.matrix,
+                        from_space='POSE', to_space='LOCAL')
+                    dq   = d_local.to_quaternion().normalized()
+                    dloc = d_local.to_translation()
+                    # Read the full constraint/driver-evaluated pose in local space.
+                    h_local = arm_ob.convert_space(
+                        pose_bone=h_pb, matrix=h_pb.matrix,
+                        from_space='POSE', to_space='LOCAL')
+                    hloc = h_local.to_translation()
+                    hq   = h_local.to_quaternion().normalized()
+                    tol = (tol_fc.evaluate(frame) if tol_fc is not None
+                           else d_pb.bone.vs.proc_tolerance)
+                    triggers.append((dq, dloc, hloc, hq, tol))
     finally:
         anim.action  = orig_action
         anim.use_nla = orig_use_nla
@@ -711,18 +778,19 @@ def _build_proc_triggers(arm_ob, entry, entry_idx: int, scene, export_print = Fa
         for pb in arm_ob.pose.bones:
             if pb.name in saved_pose:
                 pb.matrix_basis = saved_pose[pb.name]
-        # Re-mute the helper if it was already overridden before this build.
-        if was_overridden:
-            _set_helper_mute(arm_ob, entry.helper_bone, True)
+        # Re-mute the helpers that were already overridden before this build.
+        for helper in was_overridden:
+            _set_helper_mute(arm_ob, helper, True)
         _building_proc_cache = False
 
-    if not export_print:
-        print(f"[ProcBones] Cached {len(triggers)} triggers for '{entry.helper_bone}' "
-            f"driven by '{entry.driver_bone}' via '{action.name}'")
-    else:
-        print(f"  - Cached {len(triggers)} triggers for '{entry.helper_bone}' "
-            f"driven by '{entry.driver_bone}' via '{action.name}'")
-    return triggers
+    for i, entry, triggers, *_ in jobs:
+        if not export_print:
+            messages[i] = (f"[ProcBones] Cached {len(triggers)} triggers for '{entry.helper_bone}' "
+                           f"driven by '{entry.driver_bone}' via '{action.name}'")
+        else:
+            messages[i] = (f"  - Cached {len(triggers)} triggers for '{entry.helper_bone}' "
+                           f"driven by '{entry.driver_bone}' via '{action.name}'")
+    return list(zip(results, messages))
 
 
 def invalidate_proc_cache(arm_name: str) -> None:
@@ -987,8 +1055,8 @@ def _rebuild_sim_arm_cache(scene) -> list[str]:
     for ob in scene.objects:
         if ob.type != 'ARMATURE' or not ob.pose:
             continue
-        if (any(pb.bone.vs.bone_is_jigglebone for pb in ob.pose.bones)
-                or ob.data.vs.proc_bones):
+        if (ob.data.vs.proc_bones
+                or any(b.vs.bone_is_jigglebone for b in ob.data.bones)):
             names.append(ob.name)
     _sim_arm_cache[scene.name] = names
     return names
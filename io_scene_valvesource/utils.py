@@ -28,7 +28,6 @@ from math import radians, pi, ceil
 from io import TextIOWrapper
 from . import datamodel
 from . import keyvalues3
-import numpy as np
 
 intsize = struct.calcsize("i")
 floatsize = struct.calcsize("f")
@@ -259,9 +258,14 @@ class State(metaclass=_StateMeta):
         assert(scene)
         cls._exportableObjects = set([ob.session_uid for ob in scene.objects if ob.type in exportable_types and not (ob.type == 'CURVE' and ob.data.bevel_depth == 0 and ob.data.extrude == 0)])
         make_export_list(scene)
+        # One pass over bpy.data.objects for every armature, rather than one per armature
+        attachments_by_arm = collections.defaultdict(list)
+        for ob in bpy.data.objects:
+            if _is_dmx_attachment(ob):
+                attachments_by_arm[ob.parent.session_uid].append(ob)
         for arm_obj in (ob for ob in scene.objects if ob.type == 'ARMATURE'):
             avs = arm_obj.data.vs
-            if _sync_object_entries(avs.arm_attachment_entries, get_attachments(arm_obj)):
+            if _sync_object_entries(avs.arm_attachment_entries, attachments_by_arm.get(arm_obj.session_uid, [])):
                 avs.arm_attachment_index = min(avs.arm_attachment_index, len(avs.arm_attachment_entries) - 1)
             if _sync_bone_entries(avs.arm_jigglebone_entries, get_jigglebones(arm_obj)):
                 avs.arm_jigglebone_index = min(avs.arm_jigglebone_index, len(avs.arm_jigglebone_entries) - 1)
@@ -911,7 +915,7 @@ def make_export_list(scene: bpy.types.Scene):
             row.prefab_type = ptype
             row.prefab_count = count
 
-def update_vmdl_container(container_class: str, nodes: list[keyvalues3.KVNode] | keyvalues3.KVNode, export_path: str | None = None,
+def update_vmdl_container(container_class: str, nodes: typing.Iterable[keyvalues3.KVNode] | keyvalues3.KVNode, export_path: str | None = None,
                           to_clipboard: bool = False) -> keyvalues3.KVDocument | bool:
     """
     Insert or update node(s) into a container inside a KV3 RootNode.
@@ -919,7 +923,8 @@ def update_vmdl_container(container_class: str, nodes: list[keyvalues3.KVNode] |
 
     Args:
         container_class: _class of container (e.g., "JiggleBoneList" or "AnimConstraintList"/"ScratchArea").
-        nodes: Single KVNode or list of KVNodes to insert.
+        nodes: Single KVNode or an iterable of KVNodes to insert (consumed once, so a
+            generator can build nodes on the fly).
         export_path: Filepath to load existing KV3 document if not clipboard.
         to_clipboard: If True, uses ScratchArea container instead of a file.
 
@@ -929,12 +934,14 @@ def update_vmdl_container(container_class: str, nodes: list[keyvalues3.KVNode] |
 
     def open_and_parse_vmdl(filepath: str) -> keyvalues3.KVNode | None:
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                text = f.read()
+            with open(filepath, "rb") as f:
+                data = f.read()
         except OSError:
             return None
         
         try:
+            # Fold CRLF/CR newlines to LF as text mode did, and drop a UTF-8 BOM.
+            text = data.decode("utf-8-sig").replace("\r\n", "\n").replace("\r", "\n")
             parser = keyvalues3.KVParser(text)
             doc = parser.parse()
 
@@ -946,8 +953,8 @@ def update_vmdl_container(container_class: str, nodes: list[keyvalues3.KVNode] |
         except Exception:
             return None
 
-    if not isinstance(nodes, list):
-        nodes = [nodes]
+    if isinstance(nodes, keyvalues3.KVNode):
+        nodes = (nodes,)
 
     root = None
     if to_clipboard:
@@ -966,18 +973,22 @@ def update_vmdl_container(container_class: str, nodes: list[keyvalues3.KVNode] |
         container = keyvalues3.KVNode(_class=container_class)
         root.add_child(container)
 
+    # Index the container's named children once; the first match wins, as before.
+    named = {}
+    for c in container.children:
+        c_name = c.properties.get("name")
+        if c_name:
+            named.setdefault((c_name, c.properties.get("_class")), c)
+
     for node in nodes:
         node_name = node.properties.get("name")
         if node_name:
-            existing = next(
-                (c for c in container.children if c.properties.get("name") == node_name and c.properties.get("_class") == node.properties.get("_class")),
-                None
-            )
+            key = (node_name, node.properties.get("_class"))
+            existing = named.get(key)
             if existing:
-                existing.children.clear()
-                for child in node.children:
-                    existing.add_child(child)
+                existing.children[:] = node.children
                 continue
+            named[key] = node
 
         container.add_child(node)
 
@@ -1356,15 +1367,12 @@ def get_attachments(ob : bpy.types.Object | None) -> list[bpy.types.Object | Non
         
     if armature is None: return []
     
-    attchs = []
-    for ob in bpy.data.objects:
-        if ob.type != 'EMPTY' or ob.parent is None or ob.parent != armature: continue
-        if ob.parent_type != 'BONE' or not ob.parent_bone.strip(): continue
-        if not ob.vs.dmx_attachment: continue
-        
-        attchs.append(ob)
-        
-    return attchs
+    return [ob for ob in bpy.data.objects if ob.parent == armature and _is_dmx_attachment(ob)]
+
+def _is_dmx_attachment(ob : bpy.types.Object) -> bool:
+    if ob.type != 'EMPTY' or ob.parent is None: return False
+    if ob.parent_type != 'BONE' or not ob.parent_bone.strip(): return False
+    return bool(ob.vs.dmx_attachment)
 
 # I forgot what I even made this for??? Unused function
 #def get_collision_cloth_bone_uses(arm_ob: bpy.types.Object, weight_threshold: float) -> set[str]:
@@ -1843,24 +1851,31 @@ def validate_dme_flex_for_export(ob) -> list:
 
 def sort_bone_by_hierarchy(bones: typing.Iterable[bpy.types.Bone]) -> list[bpy.types.Bone]:
     bone_set = set(bones)
+
+    # Build the parent -> children map once from the input set so the walk never goes
+    # back through bone.children / bone.parent. Siblings stay name-sorted, which keeps
+    # the emitted order (and therefore QC/VMDL output) stable.
+    children = collections.defaultdict(list)
+    roots = []
+    for b in bone_set:
+        parent = b.parent
+        if parent is None or parent not in bone_set:
+            roots.append(b)
+        else:
+            children[parent].append(b)
+
+    def by_name(b):
+        return b.name
+
     sorted_bones = []
-    visited = set()
-    
-    def dfs(bone):
-        if bone in visited or bone not in bone_set:
-            return
-        visited.add(bone)
+    stack = sorted(roots, key=by_name, reverse=True)
+    while stack:
+        bone = stack.pop()
         sorted_bones.append(bone)
-        
-        for child in sorted(bone.children, key=lambda b: b.name):
-            if child in bone_set:
-                dfs(child)
-    
-    roots = [b for b in bone_set if b.parent is None or b.parent not in bone_set]
-    
-    for root in sorted(roots, key=lambda b: b.name):
-        dfs(root)
-    
+        kids = children.get(bone)
+        if kids:
+            stack.extend(sorted(kids, key=by_name, reverse=True))
+
     return sorted_bones
 
 def get_bone_exportname(bone: bpy.types.Bone | bpy.types.PoseBone | None, for_write = False) -> str:
@@ -1877,10 +1892,21 @@ def get_bone_exportname(bone: bpy.types.Bone | bpy.types.PoseBone | None, for_wr
     if armature is None: 
         return bone.name
     
+    if armature.data.vs.ignore_bone_exportnames and not for_write:
+        return bone.name
+
+    return get_bone_exportnames(armature, for_write)[data_bone.name]
+
+def get_bone_exportnames(armature: bpy.types.Object, for_write = False) -> dict[str, str]:
+    """Map every bone name of the armature to its export name.
+
+    Numbered names ($) depend on the whole hierarchy, so get_bone_exportname has to
+    build this map anyway; callers naming many bones should build it once and index it.
+    """
     arm_prop = armature.data.vs
     
     if arm_prop.ignore_bone_exportnames and not for_write:
-        return bone.name
+        return {b.name: b.name for b in armature.data.bones}
 
     def get_bone_side(b: bpy.types.Bone) -> str:
         bone_x = b.matrix_local.to_translation().x
@@ -1912,7 +1938,7 @@ def get_bone_exportname(bone: bpy.types.Bone | bpy.types.PoseBone | None, for_wr
         final_name = sanitize_string(final_name)
         export_names[b.name] = final_name
 
-    return export_names[data_bone.name]
+    return export_names
 
 def get_bone_matrix(data: bpy.types.PoseBone | mathutils.Matrix, bone: bpy.types.PoseBone | None = None,
                     rest_space : bool = False) -> mathutils.Matrix:
@@ -1944,25 +1970,34 @@ def get_bone_matrix(data: bpy.types.PoseBone | mathutils.Matrix, bone: bpy.types
     rot_y = 0.0 if b_props.ignore_rotation_offset else b_props.export_rotation_offset_y
     rot_z = 0.0 if b_props.ignore_rotation_offset else b_props.export_rotation_offset_z
 
-    rot_offset_matrix = (
-        mathutils.Matrix.Rotation(rot_z, 4, 'Z') @ # type: ignore
-        mathutils.Matrix.Rotation(rot_y, 4, 'Y') @ # type: ignore
-        mathutils.Matrix.Rotation(rot_x, 4, 'X')  # type: ignore
-    )
-
     # Location offsets
     loc_x = 0.0 if b_props.ignore_location_offset else b_props.export_location_offset_x
     loc_y = 0.0 if b_props.ignore_location_offset else b_props.export_location_offset_y
     loc_z = 0.0 if b_props.ignore_location_offset else b_props.export_location_offset_z
 
-    loc_offset_matrix = mathutils.Matrix.Translation((loc_x, loc_y, loc_z))
+    # Most bones carry no offsets at all
+    if not (rot_x or rot_y or rot_z or loc_x or loc_y or loc_z):
+        return matrix.copy()
+
+    offset_matrix = (
+        mathutils.Matrix.Rotation(rot_z, 4, 'Z') @ # type: ignore
+        mathutils.Matrix.Rotation(rot_y, 4, 'Y') @ # type: ignore
+        mathutils.Matrix.Rotation(rot_x, 4, 'X')  # type: ignore
+    )
 
-    # Translation after rotation
-    offset_matrix = loc_offset_matrix @ rot_offset_matrix
+    # Translation after rotation: Translation(loc) @ rot only fills in the translation column
+    offset_matrix.translation = (loc_x, loc_y, loc_z)
 
     # Apply offsets in bone space
     return matrix @ offset_matrix
 
+_IDENTITY_4X4_FLAT = tuple(float(i == j) for i in range(4) for j in range(4))
+
+def reset_pose_bones(armature: bpy.types.Object) -> None:
+    """Set matrix_basis of every pose bone to identity with a single foreach_set call."""
+    pose_bones = armature.pose.bones
+    pose_bones.foreach_set("matrix_basis", _IDENTITY_4X4_FLAT * len(pose_bones))
+
 #
 #   BOOL
 #
@@ -406,14 +406,14 @@ _HBOX_COLORS = {
 }
 
 
-def _draw_hitbox_for_bone(shader, ob, pb, hb):
-    """Draw a single hitbox entry (box or capsule) in bone-local space."""
-    bone_mat  = ob.matrix_world @ get_bone_matrix(pb)
+def _draw_hitbox_for_bone(shader, bone_mat, hb):
+    """Draw a single hitbox entry (box or capsule) in bone-local space.
+    bone_mat is the world-space export matrix of the hitbox's parent bone."""
     arm_scale = Vector((bone_mat[0][0], bone_mat[1][0], bone_mat[2][0])).length
 
     r, g, b = _HBOX_COLORS.get(int(hb.group) if hb.group.isdigit() else 0, (1.0, 1.0, 1.0))
 
-    rot_mat = Euler((hb.rotation[0], hb.rotation[1], hb.rotation[2]), 'XYZ').to_matrix()
+    rot_mat = Euler(tuple(hb.rotation), 'XYZ').to_matrix()
     bm3     = bone_mat.to_3x3()
 
     # Axes in world space (not normalized - magnitude encodes object scale,
@@ -836,10 +836,16 @@ def _draw_export_pose_preview():
                 gpu.state.depth_test_set('ALWAYS')
                 gpu.state.face_culling_set('NONE')
                 shader_hb.bind()
+                # Hitboxes commonly share a parent bone; resolve each bone matrix once.
+                bone_mats = {}
                 for hb in to_draw:
-                    pb_hb = ob.pose.bones.get(hb.bone_name)
-                    if pb_hb:
-                        _draw_hitbox_for_bone(shader_hb, ob, pb_hb, hb)
+                    bone_mat = bone_mats.get(hb.bone_name)
+                    if bone_mat is None:
+                        pb_hb = ob.pose.bones.get(hb.bone_name)
+                        if not pb_hb:
+                            continue
+                        bone_mat = bone_mats[hb.bone_name] = ob.matrix_world @ get_bone_matrix(pb_hb)
+                    _draw_hitbox_for_bone(shader_hb, bone_mat, hb)
                 gpu.state.face_culling_set('NONE')
                 gpu.state.blend_set('NONE')
                 gpu.state.depth_test_set('NONE')